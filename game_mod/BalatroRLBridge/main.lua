@@ -10,6 +10,8 @@ local CONFIG = {
     host = "127.0.0.1",
     port = 7777,
     max_request_size = 65536,
+    keepalive_timeout = 5,  -- Seconds an idle keep-alive connection stays open
+    gzip_min_size = 1024,   -- Smallest response body worth gzipping, if the client accepts it
     schema_version = "1.0.0",
 }
 
@@ -281,32 +283,53 @@ local function parse_http_request(data)
     }
 end
 
-local function send_response(client, status_code, status_text, body, content_type)
+-- Gzip a response body, or return nil if it is too small or love.data is unavailable
+local function gzip_body(body)
+    if #body < CONFIG.gzip_min_size or not (love and love.data and love.data.compress) then
+        return nil
+    end
+    local ok, compressed = pcall(love.data.compress, "string", "gzip", body)
+    if ok then return compressed end
+    return nil
+end
+
+local function send_response(client, status_code, status_text, body, content_type, keep_alive, gzip)
     content_type = content_type or "application/json"
+    local encoding_header = ""
+    if gzip then
+        local compressed = gzip_body(body)
+        if compressed then
+            body = compressed
+            encoding_header = "Content-Encoding: gzip\r\n"
+        end
+    end
     local response = string.format(
         "HTTP/1.1 %d %s\r\n" ..
         "Content-Type: %s\r\n" ..
+        "%s" ..
         "Content-Length: %d\r\n" ..
-        "Connection: close\r\n" ..
+        "Connection: %s\r\n" ..
         "Access-Control-Allow-Origin: *\r\n" ..
         "Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n" ..
         "Access-Control-Allow-Headers: Content-Type\r\n" ..
         "\r\n%s",
         status_code, status_text,
         content_type,
+        encoding_header,
         #body,
+        keep_alive and "keep-alive" or "close",
         body
     )
     client:send(response)
 end
 
-local function send_json(client, status_code, data)
+local function send_json(client, status_code, data, keep_alive, gzip)
     local status_text = status_code == 200 and "OK" or
                         status_code == 400 and "Bad Request" or
                         status_code == 404 and "Not Found" or
                         status_code == 500 and "Internal Server Error" or
                         "Unknown"
-    send_response(client, status_code, status_text, json_encode(data), "application/json")
+    send_response(client, status_code, status_text, json_encode(data), "application/json", keep_alive, gzip)
 end
 
 --------------------------------------------------------------------------------
@@ -1418,6 +1441,16 @@ local function execute_action(action_data)
         -- Small delay might be needed for state to update
         result.state = build_game_state()
         result.legal = get_legal_actions()
+    else
+        -- Attach the (unchanged) state on failure too so clients don't need a
+        -- follow-up /state + /legal round trip. Best effort: a failed action
+        -- must still come back as ok=false rather than a 500.
+        local ok_state, state = pcall(build_game_state)
+        local ok_legal, legal = pcall(get_legal_actions)
+        if ok_state and ok_legal then
+            result.state = state
+            result.legal = legal
+        end
     end
 
     return result
@@ -1449,6 +1482,15 @@ function handlers.GET_legal(req)
     return get_legal_actions()
 end
 
+-- State and legal actions in one response, saving a round trip over
+-- separate /state and /legal requests
+function handlers.GET_observe(req)
+    return {
+        state = build_game_state(),
+        legal = get_legal_actions(),
+    }
+end
+
 function handlers.POST_action(req)
     local action_data = req.body and json_decode(req.body)
     if not action_data then
@@ -1536,6 +1578,23 @@ end
 
 local pending_clients = {}
 
+-- HTTP/1.1 connections stay open unless the client asks otherwise
+local function wants_keep_alive(req)
+    local connection = (req.headers["connection"] or ""):lower()
+    if req.version == "1.0" then
+        return connection == "keep-alive"
+    end
+    return connection ~= "close"
+end
+
+-- Responses are only gzipped for clients that ask for it
+local function wants_gzip(req)
+    local accept = (req.headers["accept-encoding"] or ""):lower()
+    return accept:find("gzip", 1, true) ~= nil
+end
+
+-- Returns handled, keep_open: whether a request was answered, and whether
+-- the connection should stay open for the next one
 local function handle_request(client)
     -- Non-blocking read: all our requests are small and fit in a single TCP segment.
     -- settimeout(0) avoids blocking the game loop for up to 1 second.
@@ -1545,7 +1604,11 @@ local function handle_request(client)
     local data = chunk or partial or ""
 
     if #data == 0 then
-        return false
+        -- Peer closed an idle keep-alive connection
+        if err == "closed" then
+            return true, false
+        end
+        return false, true
     end
 
     request_count = request_count + 1
@@ -1553,9 +1616,11 @@ local function handle_request(client)
     local req = parse_http_request(data)
     if not req then
         send_json(client, 400, {error = "Invalid HTTP request"})
-        return true
+        return true, false
     end
 
+    local keep_alive = wants_keep_alive(req)
+
     -- Body is already included in the initial read for all our small payloads.
     -- No retry loop needed.
 
@@ -1574,16 +1639,16 @@ local function handle_request(client)
     if handler then
         local ok, result = pcall(handler, req)
         if ok then
-            send_json(client, 200, result)
+            send_json(client, 200, result, keep_alive, wants_gzip(req))
         else
             log_error("Handler error: " .. tostring(result))
-            send_json(client, 500, {error = "Internal server error", details = tostring(result)})
+            send_json(client, 500, {error = "Internal server error", details = tostring(result)}, keep_alive)
         end
     else
-        send_json(client, 404, {error = "Not found", path = path, method = req.method})
+        send_json(client, 404, {error = "Not found", path = path, method = req.method}, keep_alive)
     end
 
-    return true
+    return true, keep_alive
 end
 
 local function server_tick()
@@ -1604,19 +1669,25 @@ local function server_tick()
     while i <= #pending_clients do
         local pc = pending_clients[i]
         local done = false
-        local timeout = (socket.gettime() - pc.time) > 5  -- 5 second timeout
+        local timeout = (socket.gettime() - pc.time) > CONFIG.keepalive_timeout
 
         if timeout then
             pc.socket:close()
             done = true
         else
-            local ok, result = pcall(handle_request, pc.socket)
+            local ok, handled, keep_open = pcall(handle_request, pc.socket)
             if not ok then
-                log_error("Request handling error: " .. tostring(result))
-                done = true
-            elseif result then
+                log_error("Request handling error: " .. tostring(handled))
                 pc.socket:close()
                 done = true
+            elseif handled then
+                if keep_open then
+                    -- Idle timeout restarts after each request
+                    pc.time = socket.gettime()
+                else
+                    pc.socket:close()
+                    done = true
+                end
             end
         end
 
@@ -1664,7 +1735,7 @@ function RLBridge.init()
     start_time = socket.gettime()
 
     log_info("HTTP server started on http://" .. CONFIG.host .. ":" .. CONFIG.port)
-    log_info("Endpoints: /health, /state, /legal, /action, /reset, /config")
+    log_info("Endpoints: /health, /state, /legal, /observe, /action, /reset, /config")
 
     return true
 end
@@ -1,8 +1,29 @@
 """Balatro RL Environment - Gymnasium-compatible RL harness for Balatro."""
 
-from balatro_env.client import BalatroClient
-from balatro_env.env import BalatroEnv
-from balatro_env.schemas import GameState, LegalActions, ActionResult
+import importlib
+
+from balatro_env.registration import register_env
+
+register_env()
 
 __version__ = "1.0.0"
-__all__ = ["BalatroClient", "BalatroEnv", "GameState", "LegalActions", "ActionResult"]
+__all__ = ["BalatroClient", "BalatroEnv", "GameState", "LegalActions", "ActionResult", "register_env"]
+
+# Public names imported on first access, so `import balatro_env` (and every
+# script entry point) doesn't pay for torch, pydantic or urllib3 up front
+_LAZY_ATTRS = {
+    "BalatroClient": "balatro_env.client",
+    "BalatroEnv": "balatro_env.env",
+    "GameState": "balatro_env.schemas",
+    "LegalActions": "balatro_env.schemas",
+    "ActionResult": "balatro_env.schemas",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
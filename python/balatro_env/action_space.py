@@ -1,11 +1,47 @@
 """Action space encoding and decoding for Balatro RL."""
 
-from itertools import combinations
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import lru_cache, partial
 from typing import Any
 
+import numpy as np
+
 from balatro_env.schemas import ActionRequest, ActionType, LegalAction, LegalActions
 
 
+@lru_cache(maxsize=4096)
+def _enumerate_submask_bitmaps(
+    available_bitmap: int, min_select: int, max_select: int
+) -> np.ndarray:
+    """Enumerate the submasks of a card bitmap whose size is within bounds.
+
+    Results are cached, so repeated game states cost a single dict lookup.
+
+    Args:
+        available_bitmap: Bitmap of cards that may be selected
+        min_select: Minimum number of selected cards
+        max_select: Maximum number of selected cards
+
+    Returns:
+        Read-only array of submask bitmaps with between min_select and max_select bits set
+    """
+    bitmaps = []
+    # int.bit_count() is a single popcount, so we can skip walking all 2^n
+    # submasks up front when no selection satisfies the bounds
+    if min_select <= max_select and min_select <= available_bitmap.bit_count():
+        sub = available_bitmap
+        while sub:
+            if min_select <= sub.bit_count() <= max_select:
+                bitmaps.append(sub)
+            sub = (sub - 1) & available_bitmap
+        if min_select <= 0:
+            bitmaps.append(0)
+    bitmaps = np.array(bitmaps, dtype=np.intp)
+    bitmaps.setflags(write=False)
+    return bitmaps
+
+
 class ActionEncoder:
     """Encodes and decodes actions for RL training.
 
@@ -19,9 +55,39 @@ class ActionEncoder:
     MAX_SHOP_SLOTS = 6
     MAX_PACK_CHOICES = 5
 
+    # Fixed attribute layout; the encoder is consulted on every env step
+    __slots__ = (
+        "simple_actions",
+        "play_hand_offset",
+        "discard_offset",
+        "shop_buy_offset",
+        "sell_joker_offset",
+        "pack_select_offset",
+        "blind_select_offset",
+        "action_space_size",
+        "_bitmap_to_indices",
+        "_indices_to_bitmap",
+        "_index_bits",
+        "_encode_handlers",
+        "_mask_handlers",
+        "_decode_bounds",
+        "_decode_handlers",
+        "_simple_decode",
+        "_fixed_decoded",
+        "_last_legal",
+        "_last_hand_size",
+        "_last_mask",
+    )
+
     def __init__(self):
         """Initialize the action encoder with fixed action space mapping."""
         self._build_action_space()
+        self._build_dispatch_tables()
+
+        # Memo of the most recent mask; the env asks for it more than once per step
+        self._last_legal: LegalActions | None = None
+        self._last_hand_size = 0
+        self._last_mask: np.ndarray | None = None
 
     def _build_action_space(self):
         """Build the complete action space mapping.
@@ -61,6 +127,16 @@ class ActionEncoder:
         # Total action space size
         self.action_space_size = self.blind_select_offset + 3  # small, big, boss
 
+        # Lookup tables over the whole bitmap domain (2^MAX_HAND_SIZE entries)
+        self._bitmap_to_indices = tuple(
+            tuple(i + 1 for i in range(self.MAX_HAND_SIZE) if (bitmap >> i) & 1)
+            for bitmap in range(1 << self.MAX_HAND_SIZE)
+        )
+        self._indices_to_bitmap = {
+            indices: bitmap for bitmap, indices in enumerate(self._bitmap_to_indices)
+        }
+        self._index_bits = {idx: 1 << (idx - 1) for idx in range(1, self.MAX_HAND_SIZE + 1)}
+
     def card_indices_to_bitmap(self, indices: list[int]) -> int:
         """Convert a list of card indices to a bitmap.
 
@@ -70,26 +146,111 @@ class ActionEncoder:
         Returns:
             Integer bitmap representing selected cards
         """
+        bitmap = self._indices_to_bitmap.get(tuple(indices))
+        if bitmap is not None:
+            return bitmap
+
+        # Unsorted, duplicate or out-of-range indices (the latter map to no bit).
+        # For hand-sized inputs this plain loop is faster than sum()/reduce()
+        # over map(), and unlike sum() it is safe for duplicate indices.
+        index_bit = self._index_bits.get
         bitmap = 0
         for idx in indices:
-            if 1 <= idx <= self.MAX_HAND_SIZE:
-                bitmap |= 1 << (idx - 1)
+            bitmap |= index_bit(idx, 0)
         return bitmap
 
-    def bitmap_to_card_indices(self, bitmap: int) -> list[int]:
-        """Convert a bitmap to a list of card indices.
+    def bitmap_to_card_indices(self, bitmap: int) -> tuple[int, ...]:
+        """Convert a bitmap to a tuple of card indices.
 
         Args:
             bitmap: Integer bitmap
 
         Returns:
-            List of card indices (1-indexed)
+            Tuple of card indices (1-indexed), shared from a lookup table
         """
-        indices = []
-        for i in range(self.MAX_HAND_SIZE):
-            if bitmap & (1 << i):
-                indices.append(i + 1)
-        return indices
+        return self._bitmap_to_indices[bitmap]
+
+    def _build_dispatch_tables(self):
+        """Build the handler tables used for encoding, decoding and masking.
+
+        Encode and mask handlers are keyed by ActionType, which Pydantic has
+        already coerced action types to, so lookups need no conversion.
+        """
+        self._encode_handlers = {
+            ActionType.SORT_HAND: self._encode_sort_hand,
+            ActionType.PLAY_HAND: partial(self._encode_card_selection, self.play_hand_offset),
+            ActionType.DISCARD: partial(self._encode_card_selection, self.discard_offset),
+            ActionType.SHOP_BUY: self._encode_shop_buy,
+            ActionType.SHOP_SELL_JOKER: self._encode_sell_joker,
+            ActionType.SELECT_PACK_ITEM: self._encode_pack_select,
+            ActionType.SELECT_PACK_CARD: self._encode_pack_select,
+            ActionType.SELECT_BLIND: self._encode_select_blind,
+        }
+        self._mask_handlers = {
+            ActionType.SORT_HAND: partial(
+                self._mark_fixed,
+                [self.simple_actions["SORT_HAND_RANK"], self.simple_actions["SORT_HAND_SUIT"]],
+            ),
+            ActionType.PLAY_HAND: partial(self._mark_card_selections, self.play_hand_offset),
+            ActionType.DISCARD: partial(self._mark_card_selections, self.discard_offset),
+            ActionType.SHOP_BUY: self._mark_shop_buy,
+            ActionType.SHOP_SELL_JOKER: self._mark_sell_joker,
+            ActionType.SELECT_PACK_ITEM: self._mark_pack_select,
+            ActionType.SELECT_PACK_CARD: self._mark_pack_select,
+            # All three blind options
+            ActionType.SELECT_BLIND: partial(
+                self._mark_fixed, slice(self.blind_select_offset, self.blind_select_offset + 3)
+            ),
+        }
+        for action_type in (
+            ActionType.SHOP_REROLL,
+            ActionType.SHOP_END,
+            ActionType.SKIP_BLIND,
+            ActionType.SKIP_PACK,
+        ):
+            action_idx = self.simple_actions[action_type.value]
+            self._encode_handlers[action_type] = partial(self._encode_fixed, action_idx)
+            self._mask_handlers[action_type] = partial(self._mark_fixed, action_idx)
+
+        # Decoding bisects the sorted block offsets to find the handler for an index
+        self._decode_bounds = (
+            0,
+            self.play_hand_offset,
+            self.discard_offset,
+            self.shop_buy_offset,
+            self.sell_joker_offset,
+            self.pack_select_offset,
+            self.blind_select_offset,
+        )
+        self._decode_handlers = (
+            self._decode_simple,
+            self._decode_play_hand,
+            self._decode_discard,
+            self._decode_shop_buy,
+            self._decode_sell_joker,
+            self._decode_pack_select,
+            self._decode_select_blind,
+        )
+        # Simple action index -> (type, params), ordered as in simple_actions
+        self._simple_decode = (
+            (ActionType.SHOP_REROLL, {}),
+            (ActionType.SHOP_END, {}),
+            (ActionType.SKIP_BLIND, {}),
+            (ActionType.SKIP_PACK, {}),
+            (ActionType.SORT_HAND, {"mode": "rank"}),
+            (ActionType.SORT_HAND, {"mode": "suit"}),
+        )
+
+        # Every index outside the two card selection blocks decodes to one of a
+        # few dozen fixed requests, so build them once and hand out the same objects
+        fixed_indices = [
+            *range(len(self._simple_decode)),
+            *range(self.shop_buy_offset, self.action_space_size),
+        ]
+        self._fixed_decoded = {}
+        for action_idx in fixed_indices:
+            block = bisect_right(self._decode_bounds, action_idx) - 1
+            self._fixed_decoded[action_idx] = self._decode_handlers[block](action_idx)
 
     def encode_action(self, action: ActionRequest) -> int:
         """Encode an action request to an integer index.
@@ -100,42 +261,39 @@ class ActionEncoder:
         Returns:
             Integer action index
         """
-        action_type = action.type.value if isinstance(action.type, ActionType) else action.type
-
-        if action_type == "SHOP_REROLL":
-            return self.simple_actions["SHOP_REROLL"]
-        elif action_type == "SHOP_END":
-            return self.simple_actions["SHOP_END"]
-        elif action_type == "SKIP_BLIND":
-            return self.simple_actions["SKIP_BLIND"]
-        elif action_type == "SKIP_PACK":
-            return self.simple_actions["SKIP_PACK"]
-        elif action_type == "SORT_HAND":
-            mode = action.params.get("mode", "rank")
-            return self.simple_actions[f"SORT_HAND_{mode.upper()}"]
-        elif action_type == "PLAY_HAND":
-            indices = action.params.get("card_indices", [])
-            bitmap = self.card_indices_to_bitmap(indices)
-            return self.play_hand_offset + bitmap
-        elif action_type == "DISCARD":
-            indices = action.params.get("card_indices", [])
-            bitmap = self.card_indices_to_bitmap(indices)
-            return self.discard_offset + bitmap
-        elif action_type == "SHOP_BUY":
-            slot = action.params.get("slot", 1)
-            return self.shop_buy_offset + slot - 1
-        elif action_type == "SHOP_SELL_JOKER":
-            joker_idx = action.params.get("joker_index", 1)
-            return self.sell_joker_offset + joker_idx - 1
-        elif action_type in ("SELECT_PACK_ITEM", "SELECT_PACK_CARD"):
-            choice_idx = action.params.get("choice_index") or action.params.get("index", 1)
-            return self.pack_select_offset + choice_idx - 1
-        elif action_type == "SELECT_BLIND":
-            options = {"small": 0, "big": 1, "boss": 2}
-            option = action.params.get("option", "small")
-            return self.blind_select_offset + options.get(option, 0)
-        else:
-            raise ValueError(f"Unknown action type: {action_type}")
+        # action.type is already coerced to ActionType when the model is validated
+        handler = self._encode_handlers.get(action.type)
+        if handler is None:
+            raise ValueError(f"Unknown action type: {getattr(action.type, 'value', action.type)}")
+        return handler(action)
+
+    def _encode_fixed(self, action_idx: int, action: ActionRequest) -> int:
+        return action_idx
+
+    def _encode_sort_hand(self, action: ActionRequest) -> int:
+        mode = action.params.get("mode", "rank")
+        return self.simple_actions[f"SORT_HAND_{mode.upper()}"]
+
+    def _encode_card_selection(self, offset: int, action: ActionRequest) -> int:
+        indices = action.params.get("card_indices", [])
+        return offset + self.card_indices_to_bitmap(indices)
+
+    def _encode_shop_buy(self, action: ActionRequest) -> int:
+        slot = action.params.get("slot", 1)
+        return self.shop_buy_offset + slot - 1
+
+    def _encode_sell_joker(self, action: ActionRequest) -> int:
+        joker_idx = action.params.get("joker_index", 1)
+        return self.sell_joker_offset + joker_idx - 1
+
+    def _encode_pack_select(self, action: ActionRequest) -> int:
+        choice_idx = action.params.get("choice_index") or action.params.get("index", 1)
+        return self.pack_select_offset + choice_idx - 1
+
+    def _encode_select_blind(self, action: ActionRequest) -> int:
+        options = {"small": 0, "big": 1, "boss": 2}
+        option = action.params.get("option", "small")
+        return self.blind_select_offset + options.get(option, 0)
 
     def decode_action(self, action_idx: int) -> ActionRequest:
         """Decode an integer action index to an action request.
@@ -144,45 +302,49 @@ class ActionEncoder:
             action_idx: Integer action index
 
         Returns:
-            ActionRequest ready to be executed
+            ActionRequest ready to be executed. Requests for parameterless,
+            shop, pack and blind actions are shared and must not be mutated.
         """
-        if action_idx == self.simple_actions["SHOP_REROLL"]:
-            return ActionRequest(type=ActionType.SHOP_REROLL)
-        elif action_idx == self.simple_actions["SHOP_END"]:
-            return ActionRequest(type=ActionType.SHOP_END)
-        elif action_idx == self.simple_actions["SKIP_BLIND"]:
-            return ActionRequest(type=ActionType.SKIP_BLIND)
-        elif action_idx == self.simple_actions["SKIP_PACK"]:
-            return ActionRequest(type=ActionType.SKIP_PACK)
-        elif action_idx == self.simple_actions["SORT_HAND_RANK"]:
-            return ActionRequest(type=ActionType.SORT_HAND, params={"mode": "rank"})
-        elif action_idx == self.simple_actions["SORT_HAND_SUIT"]:
-            return ActionRequest(type=ActionType.SORT_HAND, params={"mode": "suit"})
-        elif self.play_hand_offset <= action_idx < self.discard_offset:
-            bitmap = action_idx - self.play_hand_offset
-            indices = self.bitmap_to_card_indices(bitmap)
-            return ActionRequest(type=ActionType.PLAY_HAND, params={"card_indices": indices})
-        elif self.discard_offset <= action_idx < self.shop_buy_offset:
-            bitmap = action_idx - self.discard_offset
-            indices = self.bitmap_to_card_indices(bitmap)
-            return ActionRequest(type=ActionType.DISCARD, params={"card_indices": indices})
-        elif self.shop_buy_offset <= action_idx < self.sell_joker_offset:
-            slot = action_idx - self.shop_buy_offset + 1
-            return ActionRequest(type=ActionType.SHOP_BUY, params={"slot": slot})
-        elif self.sell_joker_offset <= action_idx < self.pack_select_offset:
-            joker_idx = action_idx - self.sell_joker_offset + 1
-            return ActionRequest(type=ActionType.SHOP_SELL_JOKER, params={"joker_index": joker_idx})
-        elif self.pack_select_offset <= action_idx < self.blind_select_offset:
-            choice_idx = action_idx - self.pack_select_offset + 1
-            return ActionRequest(type=ActionType.SELECT_PACK_ITEM, params={"choice_index": choice_idx})
-        elif self.blind_select_offset <= action_idx < self.action_space_size:
-            options = ["small", "big", "boss"]
-            option_idx = action_idx - self.blind_select_offset
-            return ActionRequest(type=ActionType.SELECT_BLIND, params={"option": options[option_idx]})
-        else:
+        request = self._fixed_decoded.get(action_idx)
+        if request is not None:
+            return request
+        if 0 <= action_idx < self.action_space_size:
+            block = bisect_right(self._decode_bounds, action_idx) - 1
+            return self._decode_handlers[block](action_idx)
+        raise ValueError(f"Invalid action index: {action_idx}")
+
+    def _decode_simple(self, action_idx: int) -> ActionRequest:
+        if action_idx >= len(self._simple_decode):
             raise ValueError(f"Invalid action index: {action_idx}")
+        action_type, params = self._simple_decode[action_idx]
+        return ActionRequest(type=action_type, params=dict(params))
+
+    def _decode_play_hand(self, action_idx: int) -> ActionRequest:
+        indices = self.bitmap_to_card_indices(action_idx - self.play_hand_offset)
+        return ActionRequest(type=ActionType.PLAY_HAND, params={"card_indices": indices})
+
+    def _decode_discard(self, action_idx: int) -> ActionRequest:
+        indices = self.bitmap_to_card_indices(action_idx - self.discard_offset)
+        return ActionRequest(type=ActionType.DISCARD, params={"card_indices": indices})
 
-    def get_legal_action_mask(self, legal_actions: LegalActions, hand_size: int = 8) -> list[bool]:
+    def _decode_shop_buy(self, action_idx: int) -> ActionRequest:
+        slot = action_idx - self.shop_buy_offset + 1
+        return ActionRequest(type=ActionType.SHOP_BUY, params={"slot": slot})
+
+    def _decode_sell_joker(self, action_idx: int) -> ActionRequest:
+        joker_idx = action_idx - self.sell_joker_offset + 1
+        return ActionRequest(type=ActionType.SHOP_SELL_JOKER, params={"joker_index": joker_idx})
+
+    def _decode_pack_select(self, action_idx: int) -> ActionRequest:
+        choice_idx = action_idx - self.pack_select_offset + 1
+        return ActionRequest(type=ActionType.SELECT_PACK_ITEM, params={"choice_index": choice_idx})
+
+    def _decode_select_blind(self, action_idx: int) -> ActionRequest:
+        options = ["small", "big", "boss"]
+        option_idx = action_idx - self.blind_select_offset
+        return ActionRequest(type=ActionType.SELECT_BLIND, params={"option": options[option_idx]})
+
+    def get_legal_action_mask(self, legal_actions: LegalActions, hand_size: int = 8) -> np.ndarray:
         """Generate a boolean mask for legal actions.
 
         Args:
@@ -190,72 +352,122 @@ class ActionEncoder:
             hand_size: Current hand size for card selection actions
 
         Returns:
-            Boolean list where True indicates a legal action
+            Read-only boolean array where True indicates a legal action.
+            Repeated calls with the same LegalActions object and hand size
+            return the same array.
         """
-        mask = [False] * self.action_space_size
+        if legal_actions is self._last_legal and hand_size == self._last_hand_size:
+            return self._last_mask
 
-        for action in legal_actions.actions:
-            action_type = action.type.value if isinstance(action.type, ActionType) else action.type
-
-            if action_type == "SHOP_REROLL":
-                mask[self.simple_actions["SHOP_REROLL"]] = True
-            elif action_type == "SHOP_END":
-                mask[self.simple_actions["SHOP_END"]] = True
-            elif action_type == "SKIP_BLIND":
-                mask[self.simple_actions["SKIP_BLIND"]] = True
-            elif action_type == "SKIP_PACK":
-                mask[self.simple_actions["SKIP_PACK"]] = True
-            elif action_type == "SORT_HAND":
-                mask[self.simple_actions["SORT_HAND_RANK"]] = True
-                mask[self.simple_actions["SORT_HAND_SUIT"]] = True
-            elif action_type == "PLAY_HAND":
-                # Mark all valid card combinations as legal
-                params = action.params
-                if params and params.card_indices:
-                    available = params.card_indices.get("available", list(range(1, hand_size + 1)))
-                    min_select = params.card_indices.get("min_select", 1)
-                    max_select = params.card_indices.get("max_select", 5)
-                    # Generate all valid combinations
-                    for size in range(min_select, min(max_select, len(available)) + 1):
-                        for combo in combinations(available, size):
-                            bitmap = self.card_indices_to_bitmap(list(combo))
-                            mask[self.play_hand_offset + bitmap] = True
-            elif action_type == "DISCARD":
-                params = action.params
-                if params and params.card_indices:
-                    available = params.card_indices.get("available", list(range(1, hand_size + 1)))
-                    min_select = params.card_indices.get("min_select", 1)
-                    max_select = params.card_indices.get("max_select", 5)
-                    for size in range(min_select, min(max_select, len(available)) + 1):
-                        for combo in combinations(available, size):
-                            bitmap = self.card_indices_to_bitmap(list(combo))
-                            mask[self.discard_offset + bitmap] = True
-            elif action_type == "SHOP_BUY":
-                params = action.params
-                if params and params.slot:
-                    slot = params.slot
-                    if 1 <= slot <= self.MAX_SHOP_SLOTS:
-                        mask[self.shop_buy_offset + slot - 1] = True
-            elif action_type == "SHOP_SELL_JOKER":
-                params = action.params
-                if params and params.joker_index:
-                    joker_idx = params.joker_index
-                    if 1 <= joker_idx <= self.MAX_JOKERS:
-                        mask[self.sell_joker_offset + joker_idx - 1] = True
-            elif action_type in ("SELECT_PACK_ITEM", "SELECT_PACK_CARD"):
-                params = action.params
-                choice_idx = None
-                if params:
-                    choice_idx = params.choice_index or params.index
-                if choice_idx and 1 <= choice_idx <= self.MAX_PACK_CHOICES:
-                    mask[self.pack_select_offset + choice_idx - 1] = True
-            elif action_type == "SELECT_BLIND":
-                # All three blind options
-                for i in range(3):
-                    mask[self.blind_select_offset + i] = True
+        mask = np.zeros(self.action_space_size, dtype=np.bool_)
+        self._fill_legal_action_mask(mask, legal_actions, hand_size)
+        mask.setflags(write=False)
 
+        self._last_legal = legal_actions
+        self._last_hand_size = hand_size
+        self._last_mask = mask
         return mask
 
+    def get_legal_action_masks(
+        self,
+        legal_actions_batch: Sequence[LegalActions],
+        hand_sizes: Sequence[int] | None = None,
+    ) -> np.ndarray:
+        """Generate legal action masks for a batch of environments at once.
+
+        Args:
+            legal_actions_batch: Legal actions for each environment
+            hand_sizes: Current hand size for each environment (defaults to 8)
+
+        Returns:
+            Boolean array of shape (batch_size, action_space_size)
+
+        Raises:
+            ValueError: If hand_sizes and legal_actions_batch differ in length
+        """
+        if hand_sizes is None:
+            hand_sizes = [8] * len(legal_actions_batch)
+
+        masks = np.zeros((len(legal_actions_batch), self.action_space_size), dtype=np.bool_)
+        for mask, legal_actions, hand_size in zip(
+            masks, legal_actions_batch, hand_sizes, strict=True
+        ):
+            self._fill_legal_action_mask(mask, legal_actions, hand_size)
+        return masks
+
+    def fill_legal_action_mask(
+        self, legal_actions: LegalActions, hand_size: int, out: np.ndarray
+    ) -> None:
+        """Write the legal action mask into a caller-owned buffer.
+
+        Lets callers reuse one preallocated array across steps instead of
+        getting a new mask per LegalActions object.
+
+        Args:
+            legal_actions: The current legal actions
+            hand_size: Current hand size for card selection actions
+            out: Writable boolean array of shape (action_space_size,)
+        """
+        out.fill(False)
+        self._fill_legal_action_mask(out, legal_actions, hand_size)
+
+    def _fill_legal_action_mask(
+        self, mask: np.ndarray, legal_actions: LegalActions, hand_size: int
+    ) -> None:
+        """Mark the legal actions in a zeroed mask (or mask row) in place."""
+        mask_handlers = self._mask_handlers
+        for action in legal_actions.actions:
+            handler = mask_handlers.get(action.type)
+            if handler is not None:
+                handler(mask, action.params, hand_size)
+
+    def _mark_fixed(
+        self, action_indices: int | list[int] | slice, mask: np.ndarray, params: Any, hand_size: int
+    ) -> None:
+        # A single index, index list or slice: one NumPy store either way
+        mask[action_indices] = True
+
+    def _mark_shop_buy(self, mask: np.ndarray, params: Any, hand_size: int) -> None:
+        if params and params.slot:
+            slot = params.slot
+            if 1 <= slot <= self.MAX_SHOP_SLOTS:
+                mask[self.shop_buy_offset + slot - 1] = True
+
+    def _mark_sell_joker(self, mask: np.ndarray, params: Any, hand_size: int) -> None:
+        if params and params.joker_index:
+            joker_idx = params.joker_index
+            if 1 <= joker_idx <= self.MAX_JOKERS:
+                mask[self.sell_joker_offset + joker_idx - 1] = True
+
+    def _mark_pack_select(self, mask: np.ndarray, params: Any, hand_size: int) -> None:
+        choice_idx = None
+        if params:
+            choice_idx = params.choice_index or params.index
+        if choice_idx and 1 <= choice_idx <= self.MAX_PACK_CHOICES:
+            mask[self.pack_select_offset + choice_idx - 1] = True
+
+    def _mark_card_selections(
+        self, offset: int, mask: np.ndarray, params: Any, hand_size: int
+    ) -> None:
+        """Mark every valid card selection for a PLAY_HAND/DISCARD action as legal.
+
+        Args:
+            offset: Action index offset of the card selection block
+            mask: Action mask to update in place
+            params: Legal action parameters
+            hand_size: Current hand size, used when no available cards are given
+        """
+        if not (params and params.card_indices):
+            return
+
+        spec = params.card_indices
+        if spec.available is None:
+            available_bitmap = (1 << min(hand_size, self.MAX_HAND_SIZE)) - 1
+        else:
+            available_bitmap = self.card_indices_to_bitmap(spec.available)
+        bitmaps = _enumerate_submask_bitmaps(available_bitmap, spec.min_select, spec.max_select)
+        mask[offset + bitmaps] = True
+
     def get_action_space_size(self) -> int:
         """Get the total action space size."""
         return self.action_space_size
@@ -1,19 +1,26 @@
 """HTTP client for communicating with the Balatro RL Bridge."""
 
+import socket
 import time
+from collections.abc import Callable
 from typing import Any
 
-import requests
-from requests.exceptions import ConnectionError, Timeout
+import orjson
+import urllib3
+from urllib3.exceptions import NewConnectionError, ProtocolError, TimeoutError
 
 from balatro_env.schemas import (
     ActionRequest,
     ActionResult,
+    GamePhase,
     GameState,
     HealthResponse,
     LegalActions,
+    Observation,
 )
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class BalatroConnectionError(Exception):
     """Raised when unable to connect to the Balatro bridge."""
@@ -34,6 +41,8 @@ class BalatroClient:
         timeout: float = 5.0,
         retry_count: int = 3,
         retry_delay: float = 0.5,
+        cache_ttl: float = 0.0,
+        compress: bool = False,
     ):
         """Initialize the client.
 
@@ -42,72 +51,127 @@ class BalatroClient:
             port: Port number of the Balatro bridge
             timeout: Request timeout in seconds
             retry_count: Number of retries for failed requests
-            retry_delay: Delay between retries in seconds
+            retry_delay: Initial delay between retries in seconds, doubled on each retry
+            cache_ttl: How long (seconds) a fetched state or legal action set
+                may be reused while no action has been sent. The game also
+                advances on its own (animations, phase transitions), so this
+                is off (0) by default.
+            compress: Ask the bridge to gzip large responses. Worth it when
+                the bridge is reached over a real network; over localhost the
+                compression time usually outweighs the bytes saved.
         """
+        self.host = host
+        self.port = port
         self.base_url = f"http://{host}:{port}"
         self.timeout = timeout
         self.retry_count = retry_count
         self.retry_delay = retry_delay
-        self._session = requests.Session()
-
-    def _request(
+        # The bridge serves one request at a time, so a single blocking
+        # keep-alive connection is reused for every call instead of a new
+        # TCP handshake per request. Retries are handled in _request_raw,
+        # not by urllib3.
+        self._pool = urllib3.HTTPConnectionPool(
+            host,
+            port,
+            maxsize=1,
+            block=True,
+            timeout=urllib3.Timeout(total=timeout),
+            retries=False,
+        )
+        # urllib3 transparently decodes gzip-encoded responses
+        self._get_headers = {"Accept-Encoding": "gzip"} if compress else {}
+        self._post_headers = {**_JSON_HEADERS, **self._get_headers}
+
+        # Observation memo: bumped on every action/reset (or invalidate()), so
+        # a cached entry is only reused within one generation and cache_ttl
+        self.cache_ttl = cache_ttl
+        self._generation = 0
+        self._cached_state: tuple[int, float, GameState] | None = None
+        self._cached_legal: tuple[int, float, LegalActions] | None = None
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff delay before retrying, capped at the request timeout."""
+        return min(self.retry_delay * (2**attempt), self.timeout)
+
+    def _request_raw(
         self,
         method: str,
         endpoint: str,
-        json_data: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
-        """Make an HTTP request with retry logic.
+        body: bytes | None = None,
+    ) -> bytes:
+        """Make an HTTP request with retry logic and return the raw response body.
 
         Args:
             method: HTTP method (GET, POST)
             endpoint: API endpoint path
-            json_data: JSON body for POST requests
+            body: Encoded JSON body for POST requests
 
         Returns:
-            Parsed JSON response
+            Raw JSON response bytes
 
         Raises:
             BalatroConnectionError: If unable to connect after retries
         """
-        url = f"{self.base_url}/{endpoint}"
+        path = f"/{endpoint}"
         last_error = None
 
         for attempt in range(self.retry_count):
             try:
                 if method == "GET":
-                    response = self._session.get(url, timeout=self.timeout)
+                    response = self._pool.request("GET", path, headers=self._get_headers)
                 elif method == "POST":
-                    response = self._session.post(url, json=json_data, timeout=self.timeout)
+                    response = self._pool.request("POST", path, body=body, headers=self._post_headers)
                 else:
                     raise ValueError(f"Unsupported HTTP method: {method}")
 
-                response.raise_for_status()
-                return response.json()
-
-            except ConnectionError as e:
-                last_error = e
-                if attempt < self.retry_count - 1:
-                    time.sleep(self.retry_delay)
-            except Timeout as e:
+            except (NewConnectionError, ProtocolError, TimeoutError) as e:
                 last_error = e
                 if attempt < self.retry_count - 1:
-                    time.sleep(self.retry_delay)
-            except requests.exceptions.HTTPError as e:
+                    time.sleep(self._backoff(attempt))
+                continue
+
+            if response.status >= 400:
                 # Don't retry HTTP errors (4xx, 5xx)
-                raise BalatroConnectionError(f"HTTP error: {e}")
+                raise BalatroConnectionError(
+                    f"HTTP error: {response.status} {response.reason} "
+                    f"for url: {self.base_url}{path}"
+                )
+            return response.data
 
         raise BalatroConnectionError(
-            f"Failed to connect to Balatro at {url} after {self.retry_count} attempts: {last_error}"
+            f"Failed to connect to Balatro at {self.base_url}{path} "
+            f"after {self.retry_count} attempts: {last_error}"
         )
 
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Make an HTTP request with retry logic.
+
+        Args:
+            method: HTTP method (GET, POST)
+            endpoint: API endpoint path
+            json_data: JSON body for POST requests
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            BalatroConnectionError: If unable to connect after retries
+        """
+        body = orjson.dumps(json_data) if json_data is not None else None
+        return orjson.loads(self._request_raw(method, endpoint, body))
+
     def health(self) -> HealthResponse:
         """Check if the Balatro bridge is running and healthy.
 
         Returns:
             HealthResponse with status, version, and uptime
         """
-        data = self._request("GET", "health")
-        return HealthResponse.model_validate(data)
+        return HealthResponse.model_validate_json(self._request_raw("GET", "health"))
 
     def is_connected(self) -> bool:
         """Check if the bridge is reachable.
@@ -131,12 +195,56 @@ class BalatroClient:
         Returns:
             True if connected within timeout, False otherwise
         """
-        start = time.time()
-        while time.time() - start < timeout:
-            if self.is_connected():
+        deadline = time.monotonic() + timeout
+        while True:
+            # A closed port fails fast here, without going through the HTTP retry loop
+            if self._port_open(poll_interval) and self.is_connected():
                 return True
-            time.sleep(poll_interval)
-        return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(poll_interval, remaining))
+
+    def _port_open(self, timeout: float) -> bool:
+        """Check whether the bridge port accepts TCP connections.
+
+        Args:
+            timeout: Connect timeout in seconds
+
+        Returns:
+            True if a connection could be opened, False otherwise
+        """
+        try:
+            with socket.create_connection((self.host, self.port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+
+    def invalidate(self):
+        """Drop any cached state and legal actions."""
+        self._generation += 1
+        self._cached_state = None
+        self._cached_legal = None
+
+    def _cache_get(self, entry: tuple[int, float, Any] | None) -> Any:
+        """Return a cached value if it is from this generation and within cache_ttl."""
+        if (
+            entry is not None
+            and entry[0] == self._generation
+            and time.monotonic() - entry[1] < self.cache_ttl
+        ):
+            return entry[2]
+        return None
+
+    def _cache_put(self, state: GameState | None = None, legal: LegalActions | None = None):
+        """Remember freshly fetched values for the current generation."""
+        if self.cache_ttl <= 0:
+            return
+        now = time.monotonic()
+        if state is not None:
+            self._cached_state = (self._generation, now, state)
+        if legal is not None:
+            self._cached_legal = (self._generation, now, legal)
 
     def get_state(self) -> GameState:
         """Fetch the current game state.
@@ -144,8 +252,16 @@ class BalatroClient:
         Returns:
             Complete GameState snapshot
         """
-        data = self._request("GET", "state")
-        return GameState.model_validate(data)
+        state = self._cache_get(self._cached_state)
+        if state is None:
+            state = self._fetch_state()
+        return state
+
+    def _fetch_state(self) -> GameState:
+        """Fetch the game state from the bridge, bypassing the cache."""
+        state = GameState.model_validate_json(self._request_raw("GET", "state"))
+        self._cache_put(state=state)
+        return state
 
     def get_legal_actions(self) -> LegalActions:
         """Fetch the current legal actions.
@@ -153,8 +269,73 @@ class BalatroClient:
         Returns:
             LegalActions with available actions for current phase
         """
-        data = self._request("GET", "legal")
-        return LegalActions.model_validate(data)
+        legal = self._cache_get(self._cached_legal)
+        if legal is None:
+            legal = LegalActions.model_validate_json(self._request_raw("GET", "legal"))
+            self._cache_put(legal=legal)
+        return legal
+
+    def get_observation(self) -> tuple[GameState, LegalActions]:
+        """Fetch the current game state and legal actions in one request.
+
+        Returns:
+            Tuple of (state, legal actions)
+        """
+        state = self._cache_get(self._cached_state)
+        legal = self._cache_get(self._cached_legal)
+        if state is None or legal is None:
+            observation = Observation.model_validate_json(self._request_raw("GET", "observe"))
+            state, legal = observation.state, observation.legal
+            self._cache_put(state, legal)
+        return state, legal
+
+    def wait_for_state(
+        self,
+        predicate: Callable[[GameState], bool],
+        timeout: float = 2.0,
+        initial_interval: float = 0.01,
+        max_interval: float = 0.16,
+    ) -> GameState:
+        """Poll the game state until it satisfies a predicate.
+
+        Polls start fast and back off exponentially, so a state that is
+        already (or soon) ready returns in milliseconds instead of after a
+        fixed sleep. Every poll goes to the bridge, even with cache_ttl set.
+
+        Args:
+            predicate: Returns True once the state is ready
+            timeout: Maximum time to wait in seconds
+            initial_interval: Delay after the first unsuccessful poll
+            max_interval: Upper bound for the delay between polls
+
+        Returns:
+            The first state satisfying the predicate, or the last state
+            polled if the timeout expired first
+        """
+        deadline = time.monotonic() + timeout
+        interval = initial_interval
+        while True:
+            state = self._fetch_state()
+            if predicate(state):
+                return state
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return state
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, max_interval)
+
+    def wait_for_phase_change(self, phase: GamePhase, timeout: float = 2.0) -> GameState:
+        """Poll the game state until the phase differs from ``phase``.
+
+        Args:
+            phase: Phase to wait to leave
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            The first state in a different phase, or the last state polled
+            if the timeout expired first
+        """
+        return self.wait_for_state(lambda state: state.phase != phase, timeout)
 
     def execute_action(self, action: ActionRequest) -> ActionResult:
         """Execute an action in the game.
@@ -165,8 +346,33 @@ class BalatroClient:
         Returns:
             ActionResult with success status and new state
         """
-        data = self._request("POST", "action", action.model_dump())
-        return ActionResult.model_validate(data)
+        # orjson encodes the str-enum type and plain params dict directly,
+        # about 3x faster than model_dump_json for this small payload
+        body = orjson.dumps({"type": action.type, "params": action.params})
+        self.invalidate()
+        result = ActionResult.model_validate_json(self._request_raw("POST", "action", body))
+        # The post-action snapshot attached to the result can serve the next read
+        self._cache_put(result.state, result.legal)
+        return result
+
+    def step(self, action: ActionRequest) -> tuple[ActionResult, GameState, LegalActions]:
+        """Execute an action and return the resulting state and legal actions.
+
+        The bridge attaches the post-action state and legal actions to the
+        action result, so this is normally a single round trip. They are only
+        fetched with a follow-up /observe request if the result does not
+        include them.
+
+        Args:
+            action: The action to execute
+
+        Returns:
+            Tuple of (action result, new state, new legal actions)
+        """
+        result = self.execute_action(action)
+        if result.state is not None and result.legal is not None:
+            return result, result.state, result.legal
+        return (result, *self.get_observation())
 
     def reset(self, seed: str | None = None) -> tuple[GameState, LegalActions]:
         """Request a game reset.
@@ -180,15 +386,14 @@ class BalatroClient:
             Tuple of (initial state, legal actions)
         """
         body = {"seed": seed} if seed else {}
+        self.invalidate()
         data = self._request("POST", "reset", body)
 
         # Reset might return an error if not fully implemented
         if "error" in data:
             raise BalatroConnectionError(f"Reset not supported: {data.get('error')}")
 
-        state = self.get_state()
-        legal = self.get_legal_actions()
-        return state, legal
+        return self.get_observation()
 
     def config(self, **kwargs) -> dict[str, Any]:
         """Update bridge configuration.
@@ -203,8 +408,8 @@ class BalatroClient:
         return data
 
     def close(self):
-        """Close the HTTP session."""
-        self._session.close()
+        """Close the HTTP connection pool."""
+        self._pool.close()
 
     def __enter__(self) -> "BalatroClient":
         return self
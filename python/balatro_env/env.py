@@ -10,6 +10,7 @@ from gymnasium import spaces
 from balatro_env.action_space import ActionEncoder
 from balatro_env.client import BalatroClient, BalatroConnectionError
 from balatro_env.obs_tokenizer import ObservationTokenizer
+from balatro_env.registration import ENV_ID, register_env  # noqa: F401 (re-exported)
 from balatro_env.schemas import ActionRequest, ActionType, GamePhase, GameState
 
 
@@ -22,6 +23,11 @@ class BalatroEnv(gym.Env):
 
     metadata = {"render_modes": ["human", "ansi"]}
 
+    INFO_MODES = ("full", "mask_only", "minimal")
+
+    # Returning to these phases ends the episode (game over)
+    TERMINAL_PHASES = frozenset({GamePhase.MENU, GamePhase.SPLASH})
+
     def __init__(
         self,
         host: str = "127.0.0.1",
@@ -31,6 +37,7 @@ class BalatroEnv(gym.Env):
         max_steps: int = 10000,
         wait_for_connection: bool = True,
         connection_timeout: float = 30.0,
+        info_mode: str = "full",
     ):
         """Initialize the Balatro environment.
 
@@ -42,14 +49,21 @@ class BalatroEnv(gym.Env):
             max_steps: Maximum steps per episode
             wait_for_connection: Whether to wait for game connection on init
             connection_timeout: Timeout for waiting for connection
+            info_mode: What step() puts in info on non-terminal steps: 'full'
+                (everything), 'mask_only' (just the action mask) or 'minimal'
+                (empty). Reset and episode-ending steps always get full info.
         """
         super().__init__()
 
+        if info_mode not in self.INFO_MODES:
+            raise ValueError(f"info_mode must be one of {self.INFO_MODES}, got {info_mode!r}")
+
         self.host = host
         self.port = port
         self.render_mode = render_mode
         self.device = device
         self.max_steps = max_steps
+        self.info_mode = info_mode
 
         # Initialize components
         self.client = BalatroClient(host=host, port=port)
@@ -68,6 +82,8 @@ class BalatroEnv(gym.Env):
         # Episode state
         self._current_state: GameState | None = None
         self._current_legal: Any = None
+        self._action_mask: np.ndarray | None = None
+        self._legal_indices: np.ndarray | None = None  # Built lazily from the mask
         self._step_count = 0
         self._episode_reward = 0.0
         self._prev_money = 0
@@ -88,8 +104,7 @@ class BalatroEnv(gym.Env):
         if self._current_state is None:
             return np.zeros(self.tokenizer.get_observation_size(), dtype=np.float32)
 
-        tensor = self.tokenizer.tokenize_state(self._current_state)
-        return tensor.cpu().numpy()
+        return self.tokenizer.tokenize_state_np(self._current_state)
 
     def _get_info(self) -> dict[str, Any]:
         """Get additional info about current state."""
@@ -115,14 +130,24 @@ class BalatroEnv(gym.Env):
                 info["chips_needed"] = self._current_state.blind.chips_needed
                 info["chips_scored"] = self._current_state.blind.chips_scored
 
-        if self._current_legal:
-            # Generate action mask
-            hand_size = len(self._current_state.hand) if self._current_state else 8
-            mask = self.action_encoder.get_legal_action_mask(self._current_legal, hand_size)
-            info["action_mask"] = np.array(mask, dtype=np.bool_)
+        if self._action_mask is not None:
+            # The encoder's mask is shared and read-only; callers get their own
+            info["action_mask"] = self._action_mask.copy()
 
         return info
 
+    def _update_action_mask(self):
+        """Recompute the cached action mask after the state or legal actions change."""
+        self._legal_indices = None
+        if self._current_legal is None:
+            self._action_mask = None
+            return
+
+        hand_size = len(self._current_state.hand) if self._current_state else 8
+        self._action_mask = self.action_encoder.get_legal_action_mask(
+            self._current_legal, hand_size
+        )
+
     def _compute_reward(self, prev_state: GameState | None, new_state: GameState) -> float:
         """Compute reward based on state transition.
 
@@ -143,24 +168,24 @@ class BalatroEnv(gym.Env):
         if prev_state is None:
             return 0.0
 
-        reward = 0.0
+        # Read each blind once; both chip and name checks need it
+        prev_blind = prev_state.blind
+        new_blind = new_state.blind
 
         # Money gained
-        money_diff = new_state.money - prev_state.money
-        reward += money_diff
+        reward = float(new_state.money - prev_state.money)
 
         # Chips scored
-        prev_chips = prev_state.blind.chips_scored if prev_state.blind else 0
-        new_chips = new_state.blind.chips_scored if new_state.blind else 0
-        chip_diff = new_chips - prev_chips
+        chip_diff = (new_blind.chips_scored if new_blind else 0) - (prev_blind.chips_scored if prev_blind else 0)
         if chip_diff > 0:
             reward += chip_diff / 1000.0 * 0.01
 
         # Blind completion
-        prev_blind_name = prev_state.blind.name if prev_state.blind else None
-        new_blind_name = new_state.blind.name if new_state.blind else None
-        if prev_blind_name and new_blind_name and prev_blind_name != new_blind_name:
-            reward += 10.0
+        if prev_blind and new_blind:
+            prev_blind_name = prev_blind.name
+            new_blind_name = new_blind.name
+            if prev_blind_name and new_blind_name and prev_blind_name != new_blind_name:
+                reward += 10.0
 
         # Ante completion
         if new_state.ante > prev_state.ante:
@@ -183,7 +208,7 @@ class BalatroEnv(gym.Env):
             True if episode should end
         """
         # Game over if returned to menu
-        if state.phase in {GamePhase.MENU, GamePhase.SPLASH}:
+        if state.phase in self.TERMINAL_PHASES:
             return True
 
         # Max steps reached
@@ -226,8 +251,8 @@ class BalatroEnv(gym.Env):
             self._current_state, self._current_legal = self.client.reset(seed=seed_str)
         except BalatroConnectionError:
             # Reset not fully implemented - just get current state
-            self._current_state = self.client.get_state()
-            self._current_legal = self.client.get_legal_actions()
+            self._current_state, self._current_legal = self.client.get_observation()
+        self._update_action_mask()
 
         self._prev_money = self._current_state.money
         self._prev_chips = self._current_state.blind.chips_scored if self._current_state.blind else 0
@@ -253,15 +278,8 @@ class BalatroEnv(gym.Env):
 
         # Execute action
         try:
-            result = self.client.execute_action(action_request)
-
-            if result.ok and result.state:
-                self._current_state = result.state
-                self._current_legal = result.legal
-            else:
-                # Action failed - re-fetch state
-                self._current_state = self.client.get_state()
-                self._current_legal = self.client.get_legal_actions()
+            _, self._current_state, self._current_legal = self.client.step(action_request)
+            self._update_action_mask()
 
         except BalatroConnectionError as e:
             # Connection lost
@@ -278,7 +296,14 @@ class BalatroEnv(gym.Env):
         terminated = self._is_terminal(self._current_state)
         truncated = self._step_count >= self.max_steps
 
-        return self._get_obs(), reward, terminated, truncated, self._get_info()
+        if terminated or truncated or self.info_mode == "full":
+            info = self._get_info()
+        elif self.info_mode == "mask_only":
+            info = {"action_mask": self.get_action_mask()}
+        else:
+            info = {}
+
+        return self._get_obs(), reward, terminated, truncated, info
 
     def render(self) -> str | None:
         """Render the current state.
@@ -295,21 +320,22 @@ class BalatroEnv(gym.Env):
             return None
 
         elif self.render_mode == "ansi":
-            lines = []
             state = self._current_state
-            lines.append(f"Phase: {state.phase.value}")
-            lines.append(f"Money: ${state.money} | Ante: {state.ante} | Round: {state.round}")
-            lines.append(f"Hands: {state.hands_remaining} | Discards: {state.discards_remaining}")
+            lines = [
+                f"Phase: {state.phase.value}",
+                f"Money: ${state.money} | Ante: {state.ante} | Round: {state.round}",
+                f"Hands: {state.hands_remaining} | Discards: {state.discards_remaining}",
+            ]
 
             if state.blind:
                 lines.append(f"Blind: {state.blind.name} - {state.blind.chips_scored:,}/{state.blind.chips_needed:,}")
 
             if state.hand:
-                hand_str = ", ".join(f"{c.rank}{c.suit[0] if c.suit else '?'}" for c in state.hand)
+                hand_str = ", ".join([c.short_name for c in state.hand])
                 lines.append(f"Hand: [{hand_str}]")
 
             if state.jokers:
-                joker_str = ", ".join(j.name or "?" for j in state.jokers)
+                joker_str = ", ".join([j.name or "?" for j in state.jokers])
                 lines.append(f"Jokers: [{joker_str}]")
 
             return "\n".join(lines)
@@ -320,19 +346,26 @@ class BalatroEnv(gym.Env):
         """Clean up resources."""
         self.client.close()
 
+    def get_info(self) -> dict[str, Any]:
+        """Get the full info dict for the current state, regardless of info_mode.
+
+        Returns:
+            Info dict as returned by reset()
+        """
+        return self._get_info()
+
     def get_action_mask(self) -> np.ndarray:
         """Get the current legal action mask.
 
         Returns:
-            Boolean array where True indicates legal action
+            Boolean array where True indicates legal action. Each call
+            returns a new writable array, so it may be modified in place.
         """
-        if self._current_legal is None:
+        if self._action_mask is None:
             # All actions masked (none legal)
             return np.zeros(self.action_space.n, dtype=np.bool_)
 
-        hand_size = len(self._current_state.hand) if self._current_state else 8
-        mask = self.action_encoder.get_legal_action_mask(self._current_legal, hand_size)
-        return np.array(mask, dtype=np.bool_)
+        return self._action_mask.copy()
 
     def sample_legal_action(self) -> int:
         """Sample a random legal action.
@@ -340,19 +373,19 @@ class BalatroEnv(gym.Env):
         Returns:
             Integer action index
         """
-        mask = self.get_action_mask()
-        legal_indices = np.where(mask)[0]
+        legal_indices = self._legal_indices
+        if legal_indices is None:
+            # Reused for repeated samples until the next transition
+            mask = self._action_mask
+            legal_indices = self._legal_indices = (
+                np.flatnonzero(mask) if mask is not None else np.empty(0, dtype=np.intp)
+            )
 
         if len(legal_indices) == 0:
             # No legal actions - return random (will likely fail)
             return self.action_space.sample()
 
-        return int(np.random.choice(legal_indices))
-
+        # The env's own Generator (seeded by reset(seed=...)) rather than the
+        # global legacy RandomState
+        return int(legal_indices[self.np_random.integers(len(legal_indices))])
 
-# Register the environment with Gymnasium
-gym.register(
-    id="Balatro-v0",
-    entry_point="balatro_env.env:BalatroEnv",
-    max_episode_steps=10000,
-)
@@ -1,7 +1,10 @@
 """Observation tokenization for transformer-based RL models."""
 
+import zlib
+from math import log10
 from typing import Any
 
+import numpy as np
 import torch
 
 from balatro_env.schemas import CardData, GamePhase, GameState, JokerData
@@ -38,6 +41,9 @@ class ObservationTokenizer:
     # Edition mapping
     EDITION_MAP = {"foil": 1, "holo": 2, "polychrome": 3, "negative": 4}
 
+    # Seal mapping
+    SEAL_MAP = {"Gold": 1, "Red": 2, "Blue": 3, "Purple": 4}
+
     # Phase mapping
     PHASE_MAP = {
         GamePhase.MENU: 0,
@@ -65,20 +71,62 @@ class ObservationTokenizer:
         """
         self.device = torch.device(device)
         self._build_embedding_dims()
+        self._build_lookup_tables()
 
     def _build_embedding_dims(self):
         """Calculate embedding dimensions."""
         # Card embedding: rank + suit + edition + enhancement + seal + flags
         self.card_features = 8  # rank, suit, edition, enhancement, seal, debuffed, highlighted, position
 
+        self.joker_features = 4  # id, rarity, sell_cost, has_ability
+        self.consumable_features = 2  # id, present
+        self.shop_item_features = 3  # type, cost, purchasable
+
+        # Section offsets within the observation vector. The first 10 slots are
+        # scalar features: phase, money, ante, round, hands, discards,
+        # chips_needed, chips_scored, deck_size, discard_size
+        self._hand_offset = 10
+        self._joker_offset = self._hand_offset + self.MAX_HAND_SIZE * self.card_features
+        self._consumable_offset = self._joker_offset + self.MAX_JOKERS * self.joker_features
+        self._shop_offset = self._consumable_offset + self.MAX_CONSUMABLES * self.consumable_features
+
         # Total observation size
-        self.obs_size = (
-            10 +  # Scalar features: phase, money, ante, round, hands, discards, chips_needed, chips_scored, deck_size, discard_size
-            self.MAX_HAND_SIZE * self.card_features +  # Hand cards
-            self.MAX_JOKERS * 4 +  # Jokers (id, rarity, sell_cost, has_ability)
-            self.MAX_CONSUMABLES * 2 +  # Consumables
-            self.MAX_SHOP_ITEMS * 3  # Shop items (type, cost, purchasable)
-        )
+        self.obs_size = self._shop_offset + self.MAX_SHOP_ITEMS * self.shop_item_features
+
+    def _build_lookup_tables(self):
+        """Precompute normalized feature values for the fixed vocabularies."""
+        self._phase_norm = {phase: value / 10.0 for phase, value in self.PHASE_MAP.items()}
+        self._rank_norm = {rank: value / 14.0 for rank, value in self.RANK_MAP.items()}
+        self._suit_norm = {suit: value / 4.0 for suit, value in self.SUIT_MAP.items()}
+        self._edition_norm = {edition: value / 4.0 for edition, value in self.EDITION_MAP.items()}
+        self._seal_norm = {seal: value / 4.0 for seal, value in self.SEAL_MAP.items()}
+
+        # Normalized id codes for open-ended names (enhancements, jokers,
+        # consumables, shop item types), filled in as new names are seen
+        self._enhancement_codes: dict[str, float] = {}
+        self._joker_codes: dict[str, float] = {}
+        self._consumable_codes: dict[str, float] = {}
+        self._shop_type_codes: dict[str, float] = {}
+
+    @staticmethod
+    def _id_code(codes: dict[str, float], name: str, vocab_size: int) -> float:
+        """Map a name to a normalized id code, memoized in ``codes``.
+
+        Uses CRC32 rather than the built-in ``hash()``, which is salted per
+        process, so the same name gets the same code across runs.
+
+        Args:
+            codes: Memo dict for this vocabulary
+            name: Name to encode
+            vocab_size: Number of distinct codes
+
+        Returns:
+            Code in [0, 1)
+        """
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = (zlib.crc32(name.encode()) % vocab_size) / vocab_size
+        return code
 
     def tokenize_card(self, card: CardData) -> list[float]:
         """Tokenize a single card.
@@ -89,41 +137,34 @@ class ObservationTokenizer:
         Returns:
             List of float features
         """
-        rank = 0
-        if card.rank:
-            rank = self.RANK_MAP.get(str(card.rank), 0)
-            if rank == 0:
-                # Try numeric rank
-                try:
-                    rank = int(card.rank)
-                except (ValueError, TypeError):
-                    rank = 0
-
-        suit = 0
-        if card.suit:
-            suit = self.SUIT_MAP.get(card.suit, 0)
-
-        edition = 0
-        if card.edition:
-            edition = self.EDITION_MAP.get(card.edition, 0)
+        return list(self._card_row(card))
+
+    def _card_row(self, card: CardData) -> tuple[float, ...]:
+        """Compute a card's feature row as plain Python floats."""
+        rank = self._rank_norm.get(card.rank, 0.0) if card.rank else 0.0
+        if not rank and card.rank:
+            # Try numeric rank
+            try:
+                rank = int(card.rank) / 14.0
+            except (ValueError, TypeError):
+                rank = 0.0
 
         # Simple numeric encoding for enhancement
-        enhancement = hash(card.enhancement or "") % self.VOCAB["enhancement"] if card.enhancement else 0
-
-        # Seal encoding
-        seal_map = {"Gold": 1, "Red": 2, "Blue": 3, "Purple": 4}
-        seal = seal_map.get(card.seal, 0) if card.seal else 0
-
-        return [
-            rank / 14.0,  # Normalized rank
-            suit / 4.0,   # Normalized suit
-            edition / 4.0,
-            enhancement / self.VOCAB["enhancement"],
-            seal / 4.0,
+        enhancement = (
+            self._id_code(self._enhancement_codes, card.enhancement, self.VOCAB["enhancement"])
+            if card.enhancement else 0.0
+        )
+
+        return (
+            rank,  # Normalized rank
+            self._suit_norm.get(card.suit, 0.0),  # Normalized suit
+            self._edition_norm.get(card.edition, 0.0),
+            enhancement,
+            self._seal_norm.get(card.seal, 0.0),
             1.0 if card.debuffed else 0.0,
             1.0 if card.highlighted else 0.0,
             (card.hand_index or 0) / self.MAX_HAND_SIZE,
-        ]
+        )
 
     def tokenize_joker(self, joker: JokerData) -> list[float]:
         """Tokenize a joker.
@@ -134,15 +175,17 @@ class ObservationTokenizer:
         Returns:
             List of float features
         """
-        # Use hash of key/name for ID
-        joker_id = hash(joker.key or joker.name or "") % self.VOCAB["joker"]
+        return list(self._joker_row(joker))
 
-        return [
-            joker_id / self.VOCAB["joker"],
+    def _joker_row(self, joker: JokerData) -> tuple[float, ...]:
+        """Compute a joker's feature row as plain Python floats."""
+        # Use a stable code of key/name for ID
+        return (
+            self._id_code(self._joker_codes, joker.key or joker.name or "", self.VOCAB["joker"]),
             (joker.rarity or 1) / 4.0,  # Rarity 1-4
             joker.sell_cost / 20.0,  # Normalize sell cost
             1.0 if joker.ability else 0.0,
-        ]
+        )
 
     def tokenize_state(self, state: GameState) -> torch.Tensor:
         """Tokenize a complete game state into a tensor.
@@ -153,68 +196,83 @@ class ObservationTokenizer:
         Returns:
             Float tensor of shape (obs_size,)
         """
-        features = []
+        return torch.from_numpy(self.tokenize_state_np(state)).to(self.device)
 
-        # Scalar features (normalized)
-        features.append(self.PHASE_MAP.get(state.phase, 8) / 10.0)
-        features.append(min(state.money, 500) / 500.0)  # Cap at 500
-        features.append(state.ante / 8.0)  # 8 antes max
-        features.append(state.round / 32.0)  # ~32 rounds per ante
-        features.append(state.hands_remaining / 5.0)  # Usually 4-5 hands
-        features.append(state.discards_remaining / 5.0)
+    def tokenize_state_np(self, state: GameState) -> np.ndarray:
+        """Tokenize a complete game state into a NumPy array.
+
+        Args:
+            state: Game state to tokenize
+
+        Returns:
+            Float32 array of shape (obs_size,)
+        """
+        # Features are written straight into a float32 array; padding slots
+        # stay zero. A fresh array per call (rather than a shared scratch
+        # buffer) keeps earlier observations valid, since callers may hold on
+        # to them and torch.from_numpy shares memory.
+        out = np.zeros(self.obs_size, dtype=np.float32)
 
         # Blind info
         chips_needed = state.blind.chips_needed if state.blind else 0
         chips_scored = state.blind.chips_scored if state.blind else 0
-        # Log scale for chips (can be very large)
-        import math
-        features.append(math.log10(max(chips_needed, 1)) / 12.0)  # Log10 scale
-        features.append(math.log10(max(chips_scored, 1)) / 12.0)
-
-        # Deck counts
-        features.append(state.deck_counts.deck_size / 52.0)
-        features.append(state.deck_counts.discard_size / 52.0)
-
-        # Hand cards (pad to MAX_HAND_SIZE)
-        for i in range(self.MAX_HAND_SIZE):
-            if i < len(state.hand):
-                features.extend(self.tokenize_card(state.hand[i]))
-            else:
-                features.extend([0.0] * self.card_features)
-
-        # Jokers (pad to MAX_JOKERS)
-        for i in range(self.MAX_JOKERS):
-            if i < len(state.jokers):
-                features.extend(self.tokenize_joker(state.jokers[i]))
-            else:
-                features.extend([0.0] * 4)
-
-        # Consumables (pad to MAX_CONSUMABLES)
-        for i in range(self.MAX_CONSUMABLES):
-            if i < len(state.consumables):
-                cons = state.consumables[i]
-                cons_id = hash(cons.key or cons.name or "") % self.VOCAB["consumable"]
-                features.extend([cons_id / self.VOCAB["consumable"], 1.0])
-            else:
-                features.extend([0.0, 0.0])
-
-        # Shop items (pad to MAX_SHOP_ITEMS) — flatten jokers+vouchers+boosters
+        # Log scale for chips (can be very large). Values <= 1 map to 0, like
+        # log10(max(x, 1)), without the max() call.
+        chips_needed_log = log10(chips_needed) / 12.0 if chips_needed > 1 else 0.0
+        chips_scored_log = log10(chips_scored) / 12.0 if chips_scored > 1 else 0.0
+
+        # Scalar features (normalized)
+        out[:self._hand_offset] = (
+            self._phase_norm.get(state.phase, 0.8),
+            min(state.money, 500) / 500.0,  # Cap at 500
+            state.ante / 8.0,  # 8 antes max
+            state.round / 32.0,  # ~32 rounds per ante
+            state.hands_remaining / 5.0,  # Usually 4-5 hands
+            state.discards_remaining / 5.0,
+            chips_needed_log,
+            chips_scored_log,
+            # Deck counts
+            state.deck_counts.deck_size / 52.0,
+            state.deck_counts.discard_size / 52.0,
+        )
+
+        # Hand cards and jokers: build each section's rows in one pass and
+        # store them with a single slice write (padding slots stay zero)
+        hand = state.hand[:self.MAX_HAND_SIZE]
+        if hand:
+            start = self._hand_offset
+            out[start:start + len(hand) * self.card_features] = [
+                feature for card in hand for feature in self._card_row(card)
+            ]
+
+        jokers = state.jokers[:self.MAX_JOKERS]
+        if jokers:
+            start = self._joker_offset
+            out[start:start + len(jokers) * self.joker_features] = [
+                feature for joker in jokers for feature in self._joker_row(joker)
+            ]
+
+        # Consumables (padded to MAX_CONSUMABLES)
+        offset = self._consumable_offset
+        for cons in state.consumables[:self.MAX_CONSUMABLES]:
+            out[offset] = self._id_code(
+                self._consumable_codes, cons.key or cons.name or "", self.VOCAB["consumable"]
+            )
+            out[offset + 1] = 1.0
+            offset += self.consumable_features
+
+        # Shop items (padded to MAX_SHOP_ITEMS) — flatten jokers+vouchers+boosters
         shop_items = []
         if state.shop:
             shop_items = list(state.shop.jokers) + list(state.shop.vouchers) + list(state.shop.boosters)
-        for i in range(self.MAX_SHOP_ITEMS):
-            if i < len(shop_items):
-                item = shop_items[i]
-                type_hash = hash(item.type) % 10
-                features.extend([
-                    type_hash / 10.0,
-                    item.cost / 50.0,  # Normalize cost
-                    1.0 if item.cost <= state.money else 0.0,  # Purchasable flag
-                ])
-            else:
-                features.extend([0.0, 0.0, 0.0])
-
-        return torch.tensor(features, dtype=torch.float32, device=self.device)
+        offset = self._shop_offset
+        for item in shop_items[:self.MAX_SHOP_ITEMS]:
+            out[offset] = self._id_code(self._shop_type_codes, item.type, 10)
+            out[offset + 1] = item.cost / 50.0  # Normalize cost
+            out[offset + 2] = 1.0 if item.cost <= state.money else 0.0  # Purchasable flag
+            offset += self.shop_item_features
+
+        return out
 
     def get_observation_size(self) -> int:
         """Get the observation vector size."""
@@ -229,5 +287,5 @@ class ObservationTokenizer:
         Returns:
             Float tensor of shape (batch_size, obs_size)
         """
-        tensors = [self.tokenize_state(s) for s in states]
-        return torch.stack(tensors)
+        batch = np.stack([self.tokenize_state_np(s) for s in states])
+        return torch.from_numpy(batch).to(self.device)
@@ -0,0 +1,24 @@
+"""Gymnasium registration for the Balatro environment.
+
+Kept separate from ``balatro_env.env`` so registering on package import only
+needs Gymnasium; the environment module (and torch) load on ``gym.make``.
+"""
+
+import gymnasium as gym
+
+ENV_ID = "Balatro-v0"
+
+
+def register_env() -> None:
+    """Register BalatroEnv with Gymnasium as ``Balatro-v0``.
+
+    Called once by the package ``__init__``, so ``gym.make("balatro_env:Balatro-v0")``
+    works; repeat calls are no-ops.
+    """
+    if ENV_ID in gym.registry:
+        return
+    gym.register(
+        id=ENV_ID,
+        entry_point="balatro_env.env:BalatroEnv",
+        max_episode_steps=10000,
+    )
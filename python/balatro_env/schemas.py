@@ -1,9 +1,32 @@
 """Pydantic schemas for Balatro game state, legal actions, and action results."""
 
+from collections import defaultdict
 from enum import Enum
-from typing import Any, Optional, Union
+from functools import cached_property
+from typing import Annotated, Any, Optional, TypeVar, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+T = TypeVar("T")
+
+
+def _empty_object_to_list(value: Any) -> Any:
+    # Lua returns {} for empty tables which becomes {} in JSON, not []
+    return [] if isinstance(value, dict) else value
+
+
+# A JSON array that the bridge may send as {} when empty. The empty object
+# is matched by pydantic-core itself, so no Python validator runs on the
+# (possibly large) raw input; only the small after-hook below does.
+LuaList = Annotated[
+    Union[list[T], Annotated[dict[str, Any], Field(max_length=0)]],
+    AfterValidator(_empty_object_to_list),
+]
+
+
+# A string field the bridge may send as a Lua number (ids, ranks), coerced
+# to str by pydantic-core. Other string fields still reject numbers.
+LuaStr = Annotated[str, Field(coerce_numbers_to_str=True)]
 
 
 class GamePhase(str, Enum):
@@ -30,10 +53,20 @@ class GamePhase(str, Enum):
         return cls.UNKNOWN
 
 
+# Phases that wait on a player decision. A module-level frozenset, so
+# membership tests don't rebuild a set literal of enum members per call.
+DECISION_PHASES = frozenset({
+    GamePhase.SELECTING_HAND,
+    GamePhase.SHOP,
+    GamePhase.BLIND_SELECT,
+    GamePhase.PACK_OPENING,
+})
+
+
 class CardData(BaseModel):
     """A playing card in hand or deck."""
-    id: str
-    rank: Optional[Union[str, int]] = None
+    id: LuaStr
+    rank: Optional[LuaStr] = None
     suit: Optional[str] = None
     name: Optional[str] = None
     edition: Optional[str] = None
@@ -45,20 +78,15 @@ class CardData(BaseModel):
     hand_index: Optional[int] = None
     area_index: Optional[int] = None
 
-    @field_validator("id", mode="before")
-    @classmethod
-    def coerce_id_to_string(cls, v):
-        return str(v) if v is not None else v
-
-    @field_validator("rank", mode="before")
-    @classmethod
-    def coerce_rank_to_string(cls, v):
-        return str(v) if v is not None else v
+    @cached_property
+    def short_name(self) -> str:
+        """Compact rank + suit initial, e.g. "10H" (computed once per card)."""
+        return f"{self.rank}{self.suit[0] if self.suit else '?'}"
 
 
 class JokerData(BaseModel):
     """A joker card."""
-    id: str
+    id: LuaStr
     name: Optional[str] = None
     key: Optional[str] = None
     rarity: Optional[int] = None
@@ -68,11 +96,6 @@ class JokerData(BaseModel):
     joker_index: Optional[int] = None
     area_index: Optional[int] = None
 
-    @field_validator("id", mode="before")
-    @classmethod
-    def coerce_id_to_string(cls, v):
-        return str(v) if v is not None else v
-
 
 class ConsumableData(BaseModel):
     """A consumable card (tarot, planet, spectral)."""
@@ -107,31 +130,17 @@ class ShopCard(BaseModel):
 
 class ShopData(BaseModel):
     """Shop state with three separate card areas."""
-    jokers: list[ShopCard] = Field(default_factory=list)
-    vouchers: list[ShopCard] = Field(default_factory=list)
-    boosters: list[ShopCard] = Field(default_factory=list)
+    jokers: LuaList[ShopCard] = Field(default_factory=list)
+    vouchers: LuaList[ShopCard] = Field(default_factory=list)
+    boosters: LuaList[ShopCard] = Field(default_factory=list)
     reroll_cost: int = 5
 
-    @field_validator("jokers", "vouchers", "boosters", mode="before")
-    @classmethod
-    def convert_empty_dict_to_list(cls, v):
-        if isinstance(v, dict) and len(v) == 0:
-            return []
-        return v
-
 
 class PackData(BaseModel):
     """Pack opening state."""
-    cards: list[dict[str, Any]] = Field(default_factory=list)
+    cards: LuaList[dict[str, Any]] = Field(default_factory=list)
     choices_remaining: int = 1
 
-    @field_validator("cards", mode="before")
-    @classmethod
-    def convert_empty_dict_to_list(cls, v):
-        if isinstance(v, dict) and len(v) == 0:
-            return []
-        return v
-
 
 class DeckCounts(BaseModel):
     """Deck and discard pile sizes."""
@@ -151,18 +160,12 @@ class GameState(BaseModel):
     schema_version: str
     timestamp_ms: int
     phase: GamePhase
-    phase_raw: Optional[str] = None  # Original phase string before enum mapping
+    # Original phase string before enum mapping, read from the same "phase" key
+    phase_raw: Optional[str] = Field(default=None, validation_alias="phase")
     error: Optional[str] = None
 
-    @model_validator(mode="before")
-    @classmethod
-    def preserve_raw_phase(cls, data: Any) -> Any:
-        if isinstance(data, dict) and "phase" in data:
-            data["phase_raw"] = data["phase"]
-        return data
-
     # Run metadata
-    run_id: Optional[Union[str, int]] = None
+    run_id: Optional[LuaStr] = None
     round: int = 0
     ante: int = 0
 
@@ -176,13 +179,13 @@ class GameState(BaseModel):
     blind: Optional[BlindData] = None
 
     # Cards in hand
-    hand: list[CardData] = Field(default_factory=list)
+    hand: LuaList[CardData] = Field(default_factory=list)
 
     # Jokers owned
-    jokers: list[JokerData] = Field(default_factory=list)
+    jokers: LuaList[JokerData] = Field(default_factory=list)
 
     # Consumables
-    consumables: list[ConsumableData] = Field(default_factory=list)
+    consumables: LuaList[ConsumableData] = Field(default_factory=list)
 
     # Shop state (when in SHOP phase)
     shop: Optional[ShopData] = None
@@ -196,27 +199,9 @@ class GameState(BaseModel):
     # Hand levels (poker hand upgrades)
     hand_levels: dict[str, HandLevel] = Field(default_factory=dict)
 
-    @field_validator("jokers", "consumables", "hand", mode="before")
-    @classmethod
-    def convert_empty_dict_to_list(cls, v):
-        # Lua returns {} for empty tables which becomes {} in JSON, not []
-        if isinstance(v, dict) and len(v) == 0:
-            return []
-        return v
-
-    @field_validator("run_id", mode="before")
-    @classmethod
-    def coerce_run_id_to_string(cls, v):
-        return str(v) if v is not None else v
-
     def is_decision_point(self) -> bool:
         """Check if current phase requires a decision from the player."""
-        return self.phase in {
-            GamePhase.SELECTING_HAND,
-            GamePhase.SHOP,
-            GamePhase.BLIND_SELECT,
-            GamePhase.PACK_OPENING,
-        }
+        return self.phase in DECISION_PHASES
 
 
 class ActionType(str, Enum):
@@ -241,9 +226,19 @@ class ActionType(str, Enum):
     START_RUN = "START_RUN"
 
 
+class CardIndicesSpec(BaseModel):
+    """Card selection constraints for PLAY_HAND/DISCARD actions."""
+    # Keys the bridge adds beyond these are kept, so to_request() echoes them
+    model_config = ConfigDict(extra="allow")
+
+    available: Optional[LuaList[int]] = None
+    min_select: int = 1
+    max_select: int = 5
+
+
 class ActionParams(BaseModel):
     """Parameters for an action."""
-    card_indices: Optional[dict[str, Any]] = None
+    card_indices: Optional[CardIndicesSpec] = None
     mode: Optional[list[str]] = None
     slot: Optional[int] = None
     cost: Optional[int] = None
@@ -263,9 +258,10 @@ class LegalAction(BaseModel):
 
     def to_request(self) -> "ActionRequest":
         """Convert to an ActionRequest for execution."""
+        # Only what the bridge sent, without defaults it never set
         return ActionRequest(
             type=self.type,
-            params=self.params.model_dump(exclude_none=True),
+            params=self.params.model_dump(exclude_unset=True),
         )
 
 
@@ -273,23 +269,25 @@ class LegalActions(BaseModel):
     """Set of legal actions available in current state."""
     schema_version: str
     phase: GamePhase
-    actions: list[LegalAction] = Field(default_factory=list)
+    actions: LuaList[LegalAction] = Field(default_factory=list)
     error: Optional[str] = None
 
-    @field_validator("actions", mode="before")
-    @classmethod
-    def convert_empty_dict_to_list(cls, v):
-        if isinstance(v, dict) and len(v) == 0:
-            return []
-        return v
+    @cached_property
+    def by_type(self) -> dict[ActionType, list[LegalAction]]:
+        """Legal actions grouped by type (built once, on first use)."""
+        grouped: defaultdict[ActionType, list[LegalAction]] = defaultdict(list)
+        for action in self.actions:
+            grouped[action.type].append(action)
+        # Plain dict, so a lookup of a missing type can't insert it
+        return dict(grouped)
 
     def has_action_type(self, action_type: ActionType) -> bool:
         """Check if a specific action type is available."""
-        return any(a.type == action_type for a in self.actions)
+        return action_type in self.by_type
 
     def get_actions_of_type(self, action_type: ActionType) -> list[LegalAction]:
         """Get all actions of a specific type."""
-        return [a for a in self.actions if a.type == action_type]
+        return list(self.by_type.get(action_type, ()))
 
 
 class ActionRequest(BaseModel):
@@ -298,6 +296,16 @@ class ActionRequest(BaseModel):
     params: dict[str, Any] = Field(default_factory=dict)
 
 
+# Fixed requests shared by the scripts, built once at import. Every caller
+# gets the same instance, so neither it nor its params dict may be mutated.
+START_RUN_REQUEST = ActionRequest(type=ActionType.START_RUN, params={"stake": 1})
+SELECT_BLIND_REQUEST = ActionRequest(type=ActionType.SELECT_BLIND)
+SHOP_REROLL_REQUEST = ActionRequest(type=ActionType.SHOP_REROLL)
+SHOP_END_REQUEST = ActionRequest(type=ActionType.SHOP_END)
+SKIP_PACK_REQUEST = ActionRequest(type=ActionType.SKIP_PACK)
+CASH_OUT_REQUEST = ActionRequest(type=ActionType.CASH_OUT)
+
+
 class ActionResult(BaseModel):
     """Result of executing an action."""
     ok: bool
@@ -306,6 +314,12 @@ class ActionResult(BaseModel):
     legal: Optional[LegalActions] = None
 
 
+class Observation(BaseModel):
+    """Game state and legal actions fetched together."""
+    state: GameState
+    legal: LegalActions
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Run several bridge scripts in one process, sharing one client.
+
+Usage:
+    python -m balatro_env.scripts [--host HOST] [--port PORT] COMMAND [ARGS ...] [+ COMMAND [ARGS ...]] ...
+
+Commands are health, state, legal, smoke and shell, each taking its script's
+usual arguments (their --host/--port are ignored in favour of the shared
+client). Chaining them this way pays for Python startup and the TCP connect
+once instead of per script:
+
+    python -m balatro_env.scripts health --quiet + state --json-only + smoke --max-actions 3
+
+Stops at the first command that exits non-zero and returns its exit code.
+"""
+
+import argparse
+import importlib
+import sys
+
+from balatro_env.client import BalatroClient
+
+# Command name -> script module whose main(argv, client) runs it
+COMMANDS = {
+    "health": "balatro_env.scripts.probe_health",
+    "state": "balatro_env.scripts.dump_state",
+    "legal": "balatro_env.scripts.list_legal_actions",
+    "smoke": "balatro_env.scripts.do_smoke_actions",
+    "shell": "balatro_env.scripts.interactive_shell",
+}
+
+SEPARATOR = "+"
+
+
+def split_commands(args: list[str]) -> list[list[str]]:
+    """Split arguments on SEPARATOR into one [name, *argv] list per command.
+
+    Args:
+        args: Arguments following the global options
+
+    Returns:
+        Non-empty command argument lists, in order
+    """
+    commands: list[list[str]] = [[]]
+    for arg in args:
+        if arg == SEPARATOR:
+            commands.append([])
+        else:
+            commands[-1].append(arg)
+    return [command for command in commands if command]
+
+
+def run_command(command: list[str], client: BalatroClient) -> int:
+    """Run one script's main() with the shared client.
+
+    Args:
+        command: Command name followed by its arguments
+        client: Shared client
+
+    Returns:
+        The script's exit code
+    """
+    name, *argv = command
+    script_main = importlib.import_module(COMMANDS[name]).main
+    try:
+        script_main(argv, client=client)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        # sys.exit("message") prints the message and means failure
+        print(e.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Run Balatro bridge scripts in one process with a shared client",
+        epilog=f"Commands: {', '.join(COMMANDS)}. Separate chained commands with '{SEPARATOR}'.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bridge host address")
+    parser.add_argument("--port", type=int, default=7777, help="Bridge port number")
+    parser.add_argument("commands", nargs=argparse.REMAINDER, help="Commands and their arguments")
+    args = parser.parse_args(argv)
+
+    commands = split_commands(args.commands)
+    if not commands:
+        parser.error("no command given")
+    for name, *_ in commands:
+        if name not in COMMANDS:
+            parser.error(f"unknown command {name!r} (choose from {', '.join(COMMANDS)})")
+
+    with BalatroClient(host=args.host, port=args.port) as client:
+        for command in commands:
+            code = run_command(command, client)
+            if code:
+                sys.exit(code)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 """Execute smoke test actions in Balatro.
 
 Usage:
-    python -m balatro_env.scripts.do_smoke_actions [--host HOST] [--port PORT]
+    python -m balatro_env.scripts.do_smoke_actions [--host HOST] [--port PORT] [--verbose]
 
 Performs safe actions based on current game phase to verify action execution:
 - SHOP: reroll (if affordable), then end shop
@@ -13,28 +13,47 @@ Performs safe actions based on current game phase to verify action execution:
 import argparse
 import sys
 import time
+from collections.abc import Callable
+from functools import partial
 
 from rich.console import Console
 from rich.panel import Panel
 
 from balatro_env.client import BalatroClient, BalatroConnectionError
-from balatro_env.schemas import ActionRequest, ActionType, GamePhase
+from balatro_env.schemas import (
+    CASH_OUT_REQUEST,
+    SELECT_BLIND_REQUEST,
+    SHOP_END_REQUEST,
+    SHOP_REROLL_REQUEST,
+    SKIP_PACK_REQUEST,
+    START_RUN_REQUEST,
+    ActionRequest,
+    ActionType,
+    GamePhase,
+)
 
 console = Console()
 
 
-def execute_and_report(client: BalatroClient, action: ActionRequest, description: str) -> bool:
-    """Execute an action and report the result."""
+def execute_and_report(
+    client: BalatroClient, action: ActionRequest, description: str, verbose: bool = False
+) -> bool:
+    """Execute an action and report the result.
+
+    Only the description and outcome are printed unless ``verbose`` is set,
+    which adds the raw action, params and resulting phase/money.
+    """
     console.print(f"\n[bold]Executing:[/bold] {description}")
-    console.print(f"  Action: {action.type.value}")
-    console.print(f"  Params: {action.params}")
+    if verbose:
+        console.print(f"  Action: {action.type.value}")
+        console.print(f"  Params: {action.params}")
 
     try:
         result = client.execute_action(action)
 
         if result.ok:
             console.print("[green]  Result: SUCCESS[/green]")
-            if result.state:
+            if verbose and result.state:
                 console.print(f"  New phase: {result.state.phase.value}")
                 console.print(f"  Money: ${result.state.money}")
             return True
@@ -47,7 +66,28 @@ def execute_and_report(client: BalatroClient, action: ActionRequest, description
         return False
 
 
-def smoke_shop(client: BalatroClient, state, legal) -> int:
+def execute_and_print(
+    client: BalatroClient, action: ActionRequest, description: str, verbose: bool = False
+) -> bool:
+    """Execute an action and report the result as one plain line.
+
+    Used when stdout is not a terminal, where Rich styling is wasted work.
+    """
+    details = f" {action.type.value} {action.params}" if verbose else ""
+    try:
+        result = client.execute_action(action)
+    except BalatroConnectionError as e:
+        print(f"{description}:{details} connection error: {e}")
+        return False
+    print(f"{description}:{details} {'ok' if result.ok else f'FAILED - {result.error}'}")
+    return result.ok
+
+
+# execute_and_report or execute_and_print, with verbosity bound
+Reporter = Callable[[BalatroClient, ActionRequest, str], bool]
+
+
+def smoke_shop(client: BalatroClient, state, legal, report: Reporter = execute_and_report) -> int:
     """Perform smoke actions in shop phase."""
     actions_taken = 0
 
@@ -64,44 +104,44 @@ def smoke_shop(client: BalatroClient, state, legal) -> int:
             console.print(f"    Booster slot {item.index}: {item.name} (${item.cost})")
 
     # Try to buy first affordable joker
-    for action in legal.actions:
-        if action.type == ActionType.SHOP_BUY and action.params and action.params.slot:
+    for action in legal.by_type.get(ActionType.SHOP_BUY, ()):
+        if action.params and action.params.slot:
             req = ActionRequest(type=ActionType.SHOP_BUY, params={"slot": action.params.slot})
-            if execute_and_report(client, req, f"Buy from joker slot {action.params.slot}"):
+            money = state.money
+            if report(client, req, f"Buy from joker slot {action.params.slot}"):
                 actions_taken += 1
-                time.sleep(0.5)
+                # The purchase is done once the money is deducted
+                state = client.wait_for_state(lambda s, money=money: s.money != money, timeout=0.5)
             break
 
     # Try to reroll if affordable
-    for action in legal.actions:
-        if action.type == ActionType.SHOP_REROLL:
-            cost = action.params.cost if action.params else 5
-            if state.money >= cost:
-                if execute_and_report(client, ActionRequest(type=ActionType.SHOP_REROLL), "Reroll shop"):
-                    actions_taken += 1
-                    time.sleep(0.5)
-                break
-
-    # End shop
-    for action in legal.actions:
-        if action.type == ActionType.SHOP_END:
-            if execute_and_report(client, ActionRequest(type=ActionType.SHOP_END), "Leave shop"):
+    for action in legal.by_type.get(ActionType.SHOP_REROLL, ()):
+        cost = action.params.cost if action.params else 5
+        if state.money >= cost:
+            money = state.money
+            if report(client, SHOP_REROLL_REQUEST, "Reroll shop"):
                 actions_taken += 1
+                state = client.wait_for_state(lambda s, money=money: s.money != money, timeout=0.5)
             break
 
+    # End shop
+    if legal.has_action_type(ActionType.SHOP_END):
+        if report(client, SHOP_END_REQUEST, "Leave shop"):
+            actions_taken += 1
+
     return actions_taken
 
 
-def smoke_hand_play(client: BalatroClient, state, legal) -> int:
+def smoke_hand_play(client: BalatroClient, state, legal, report: Reporter = execute_and_report) -> int:
     """Perform smoke actions in hand selection phase."""
     actions_taken = 0
 
     # Play as many cards as possible (up to 5) for maximum scoring
-    for action in legal.actions:
-        if action.type == ActionType.PLAY_HAND and action.params:
+    for action in legal.by_type.get(ActionType.PLAY_HAND, ()):
+        if action.params:
             params = action.params
             if params.card_indices:
-                available = params.card_indices.get("available", [])
+                available = params.card_indices.available or []
                 if available:
                     # Play up to 5 cards for best scoring
                     cards_to_play = available[:5]
@@ -109,23 +149,23 @@ def smoke_hand_play(client: BalatroClient, state, legal) -> int:
                         type=ActionType.PLAY_HAND,
                         params={"card_indices": cards_to_play}
                     )
-                    if execute_and_report(client, req, f"Play {len(cards_to_play)} cards {cards_to_play}"):
+                    if report(client, req, f"Play {len(cards_to_play)} cards {cards_to_play}"):
                         actions_taken += 1
                     return actions_taken
 
     # If no play available, try discard
-    for action in legal.actions:
-        if action.type == ActionType.DISCARD and action.params:
+    for action in legal.by_type.get(ActionType.DISCARD, ()):
+        if action.params:
             params = action.params
             if params.card_indices:
-                available = params.card_indices.get("available", [])
+                available = params.card_indices.available or []
                 if available:
                     card_to_discard = [available[0]]
                     req = ActionRequest(
                         type=ActionType.DISCARD,
                         params={"card_indices": card_to_discard}
                     )
-                    if execute_and_report(client, req, f"Discard card (index {card_to_discard[0]})"):
+                    if report(client, req, f"Discard card (index {card_to_discard[0]})"):
                         actions_taken += 1
                     return actions_taken
 
@@ -133,7 +173,7 @@ def smoke_hand_play(client: BalatroClient, state, legal) -> int:
     return actions_taken
 
 
-def smoke_pack(client: BalatroClient, state, legal) -> int:
+def smoke_pack(client: BalatroClient, state, legal, report: Reporter = execute_and_report) -> int:
     """Perform smoke actions in pack opening phase."""
     actions_taken = 0
 
@@ -144,46 +184,58 @@ def smoke_pack(client: BalatroClient, state, legal) -> int:
             console.print(f"    Card {card.get('index', '?')}: {card.get('name', 'Unknown')} ({card.get('type', '?')})")
 
     # Try to select first pack card (new action type)
-    for action in legal.actions:
-        if action.type == ActionType.SELECT_PACK_CARD and action.params:
+    for action in legal.by_type.get(ActionType.SELECT_PACK_CARD, ()):
+        if action.params:
             idx = action.params.index
             req = ActionRequest(
                 type=ActionType.SELECT_PACK_CARD,
                 params={"index": idx}
             )
-            if execute_and_report(client, req, f"Select pack card {idx}"):
+            if report(client, req, f"Select pack card {idx}"):
                 actions_taken += 1
-                time.sleep(0.5)
+                client.wait_for_phase_change(GamePhase.PACK_OPENING, timeout=0.5)
             return actions_taken
 
     # Skip pack if can't select
-    for action in legal.actions:
-        if action.type == ActionType.SKIP_PACK:
-            if execute_and_report(client, ActionRequest(type=ActionType.SKIP_PACK), "Skip pack"):
-                actions_taken += 1
-            return actions_taken
+    if legal.has_action_type(ActionType.SKIP_PACK):
+        if report(client, SKIP_PACK_REQUEST, "Skip pack"):
+            actions_taken += 1
 
     return actions_taken
 
 
-def main():
+def main(argv: list[str] | None = None, client: BalatroClient | None = None):
+    """Run the smoke actions.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        client: Client to reuse; when omitted, one is built from
+            --host/--port and closed on exit
+    """
     parser = argparse.ArgumentParser(description="Execute smoke test actions in Balatro")
     parser.add_argument("--host", default="127.0.0.1", help="Bridge host address")
     parser.add_argument("--port", type=int, default=7777, help="Bridge port number")
     parser.add_argument("--max-actions", type=int, default=5, help="Maximum actions to take")
-    args = parser.parse_args()
+    parser.add_argument("--verbose", action="store_true", help="Print action params and resulting state")
+    args = parser.parse_args(argv)
 
-    try:
-        client = BalatroClient(host=args.host, port=args.port)
+    # Pick the reporter once: plain lines when output is piped or redirected
+    reporter = execute_and_report if sys.stdout.isatty() else execute_and_print
+    report = partial(reporter, verbose=args.verbose)
 
+    # One client for the whole run, so every iteration reuses its
+    # keep-alive connection; closed on every exit path
+    owns_client = client is None
+    if owns_client:
+        client = BalatroClient(host=args.host, port=args.port)
+    try:
         total_actions = 0
 
         for iteration in range(args.max_actions):
             console.print(Panel.fit(f"Iteration {iteration + 1}", border_style="blue"))
 
-            # Get current state
-            state = client.get_state()
-            legal = client.get_legal_actions()
+            # Get current state and legal actions in one round trip
+            state, legal = client.get_observation()
 
             console.print(f"[bold]Phase:[/bold] {state.phase.value}")
             console.print(f"[bold]Available actions:[/bold] {len(legal.actions)}")
@@ -198,7 +250,7 @@ def main():
 
             if not legal.actions:
                 console.print("[yellow]No actions available - game may be in transition[/yellow]")
-                time.sleep(1)
+                client.wait_for_phase_change(state.phase, timeout=1.0)
                 continue
 
             # Execute phase-appropriate actions
@@ -206,37 +258,32 @@ def main():
 
             if state.phase == GamePhase.MENU:
                 # Start a new run from the menu
-                for action in legal.actions:
-                    if action.type == ActionType.START_RUN:
-                        req = ActionRequest(type=ActionType.START_RUN, params={"stake": 1})
-                        if execute_and_report(client, req, "Start new run (stake 1)"):
-                            actions_taken += 1
-                            time.sleep(3)  # Wait for run to start
-                        break
+                if legal.has_action_type(ActionType.START_RUN):
+                    if report(client, START_RUN_REQUEST, "Start new run (stake 1)"):
+                        actions_taken += 1
+                        # Wait for run to start
+                        client.wait_for_phase_change(GamePhase.MENU, timeout=3.0)
             elif state.phase == GamePhase.SHOP:
-                actions_taken = smoke_shop(client, state, legal)
+                actions_taken = smoke_shop(client, state, legal, report)
             elif state.phase == GamePhase.SELECTING_HAND:
-                actions_taken = smoke_hand_play(client, state, legal)
+                actions_taken = smoke_hand_play(client, state, legal, report)
             elif state.phase == GamePhase.PACK_OPENING:
-                actions_taken = smoke_pack(client, state, legal)
+                actions_taken = smoke_pack(client, state, legal, report)
             elif state.phase == GamePhase.BLIND_SELECT:
                 # Select the blind (small blind by default)
-                for action in legal.actions:
-                    if action.type == ActionType.SELECT_BLIND:
-                        req = ActionRequest(type=ActionType.SELECT_BLIND, params={})
-                        if execute_and_report(client, req, "Select blind"):
-                            actions_taken += 1
-                            time.sleep(2)  # Wait for blind selection animation
-                        break
+                if legal.has_action_type(ActionType.SELECT_BLIND):
+                    if report(client, SELECT_BLIND_REQUEST, "Select blind"):
+                        actions_taken += 1
+                        # Wait for blind selection animation
+                        client.wait_for_phase_change(GamePhase.BLIND_SELECT, timeout=2.0)
             elif state.phase == GamePhase.ROUND_EVAL:
                 # Cash out to proceed to shop — retry until guard passes
                 for _ in range(5):
-                    req = ActionRequest(type=ActionType.CASH_OUT, params={})
-                    result = client.execute_action(req)
+                    result = client.execute_action(CASH_OUT_REQUEST)
                     if result.ok:
                         console.print("[green]  Cash out: SUCCESS[/green]")
                         actions_taken += 1
-                        time.sleep(1)
+                        client.wait_for_phase_change(GamePhase.ROUND_EVAL, timeout=1.0)
                         break
                     else:
                         console.print(f"[yellow]  Cash out not ready: {result.error} - retrying...[/yellow]")
@@ -244,7 +291,7 @@ def main():
             elif state.phase == GamePhase.GAME_OVER:
                 # Wait for game over animation to finish, then start a new run
                 console.print("[yellow]Game over - waiting for transition...[/yellow]")
-                time.sleep(2)
+                client.wait_for_phase_change(GamePhase.GAME_OVER, timeout=2.0)
             else:
                 console.print(f"[yellow]Unknown phase {state.phase.value} - observing only[/yellow]")
 
@@ -252,7 +299,7 @@ def main():
 
             if actions_taken == 0:
                 console.print("[yellow]No actions taken this iteration[/yellow]")
-                time.sleep(0.5)
+                client.wait_for_phase_change(state.phase, timeout=0.5)
 
         console.print(Panel.fit(
             f"[bold]Total actions executed:[/bold] {total_actions}",
@@ -260,13 +307,16 @@ def main():
             border_style="green"
         ))
 
-        client.close()
         sys.exit(0)
 
     except BalatroConnectionError as e:
         console.print(f"[red]Connection error:[/red] {e}")
         sys.exit(1)
 
+    finally:
+        if owns_client:
+            client.close()
+
 
 if __name__ == "__main__":
     main()
@@ -2,9 +2,10 @@
 """Dump the current Balatro game state.
 
 Usage:
-    python -m balatro_env.scripts.dump_state [--host HOST] [--port PORT] [--output DIR]
+    python -m balatro_env.scripts.dump_state [--host HOST] [--port PORT] [--output DIR] [--quiet]
 
 Fetches the current game state, validates it, prints a summary, and saves to JSON.
+With --quiet, only the saved file path is printed.
 """
 
 import argparse
@@ -18,17 +19,32 @@ from balatro_env.util import print_state_summary, save_state_artifact
 console = Console()
 
 
-def main():
+def main(argv: list[str] | None = None, client: BalatroClient | None = None):
+    """Dump the current game state.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        client: Client to reuse; when omitted, one is built from
+            --host/--port and closed on exit
+    """
     parser = argparse.ArgumentParser(description="Dump Balatro game state")
     parser.add_argument("--host", default="127.0.0.1", help="Bridge host address")
     parser.add_argument("--port", type=int, default=7777, help="Bridge port number")
     parser.add_argument("--output", default="artifacts", help="Output directory for JSON")
     parser.add_argument("--json-only", action="store_true", help="Only output JSON, no summary")
-    args = parser.parse_args()
+    parser.add_argument("--quiet", action="store_true", help="Only print the saved file path")
+    args = parser.parse_args(argv)
 
-    try:
+    owns_client = client is None
+    if owns_client:
         client = BalatroClient(host=args.host, port=args.port)
-        console.print(f"Fetching state from {args.host}:{args.port}...")
+    try:
+        if args.quiet:
+            # Plain output, no Rich rendering
+            print(save_state_artifact(client.get_state(), args.output))
+            sys.exit(0)
+
+        console.print(f"Fetching state from {client.host}:{client.port}...")
 
         state = client.get_state()
 
@@ -51,13 +67,16 @@ def main():
         console.print(f"  Consumables: {len(state.consumables)}")
         console.print(f"  Is decision point: {state.is_decision_point()}")
 
-        client.close()
         sys.exit(0)
 
     except BalatroConnectionError as e:
         console.print(f"[red]Connection error:[/red] {e}")
         sys.exit(1)
 
+    finally:
+        if owns_client:
+            client.close()
+
 
 if __name__ == "__main__":
     main()
@@ -11,24 +11,44 @@ Provides a REPL to:
 """
 
 import argparse
-import json
+import atexit
 import sys
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
 
+try:
+    import readline  # Line editing and history for input()
+except ImportError:  # Not available on Windows
+    readline = None
+
+from pydantic import ValidationError
 from rich.console import Console
 from rich.panel import Panel
-from rich.prompt import Prompt
 
 from balatro_env.client import BalatroClient, BalatroConnectionError
-from balatro_env.schemas import ActionRequest, ActionType
+from balatro_env.schemas import (
+    SELECT_BLIND_REQUEST,
+    SHOP_END_REQUEST,
+    SHOP_REROLL_REQUEST,
+    SKIP_PACK_REQUEST,
+    START_RUN_REQUEST,
+    ActionRequest,
+    ActionType,
+)
 from balatro_env.util import print_legal_actions, print_state_summary
 
 console = Console()
 
+HISTORY_FILE = Path.home() / ".balatro_shell_history"
+HISTORY_LENGTH = 1000
+
 HELP_TEXT = """
 [bold]Available Commands:[/bold]
 
   [cyan]state[/cyan], [cyan]s[/cyan]         - Show current game state
   [cyan]legal[/cyan], [cyan]l[/cyan]         - Show legal actions
+  [cyan]observe[/cyan], [cyan]o[/cyan]       - Show state and legal actions (one request)
   [cyan]health[/cyan], [cyan]h[/cyan]        - Check bridge health
   [cyan]action[/cyan] <json>    - Execute an action (JSON format)
   [cyan]select[/cyan] <indices> - Select/highlight cards (e.g., 'select 1 2 3')
@@ -64,14 +84,10 @@ HELP_TEXT = """
 
 
 def parse_indices(args: list[str]) -> list[int]:
-    """Parse card indices from command arguments."""
-    indices = []
-    for arg in args:
-        try:
-            indices.append(int(arg))
-        except ValueError:
-            pass
-    return indices
+    """Parse card indices from command arguments, skipping non-numeric tokens."""
+    # Indices are 1-based, so only plain digit tokens need parsing; testing
+    # isdecimal() first avoids a raise/catch per bad token
+    return [int(arg) for arg in args if arg.isdecimal()]
 
 
 def execute_action(client: BalatroClient, action: ActionRequest):
@@ -96,34 +112,205 @@ def execute_action(client: BalatroClient, action: ActionRequest):
         console.print(f"[red]Connection error:[/red] {e}")
 
 
-def main():
+def cmd_help(client: BalatroClient, args: list[str]):
+    """Show the command help."""
+    console.print(HELP_TEXT)
+
+
+def cmd_state(client: BalatroClient, args: list[str]):
+    """Show the current game state."""
+    print_state_summary(client.get_state())
+
+
+def cmd_legal(client: BalatroClient, args: list[str]):
+    """Show the current legal actions."""
+    print_legal_actions(client.get_legal_actions())
+
+
+def cmd_observe(client: BalatroClient, args: list[str]):
+    """Show the current game state and legal actions, fetched together."""
+    state, legal = client.get_observation()
+    print_state_summary(state)
+    print_legal_actions(legal)
+
+
+def cmd_health(client: BalatroClient, args: list[str]):
+    """Show bridge health."""
+    health = client.health()
+    console.print(f"Status: {health.status}")
+    console.print(f"Uptime: {health.uptime_ms / 1000:.1f}s")
+    console.print(f"Requests: {health.request_count}")
+
+
+def cmd_action(client: BalatroClient, args: list[str]):
+    """Execute an action given as JSON."""
+    if not args:
+        console.print("[yellow]Usage: action <json>[/yellow]")
+        return
+    try:
+        # Parsed and validated in a single pydantic-core pass
+        action = ActionRequest.model_validate_json(" ".join(args))
+    except ValidationError as e:
+        error = e.errors()[0]
+        if error["type"] == "json_invalid":
+            console.print(f"[red]Invalid JSON:[/red] {error['ctx']['error']}")
+        else:
+            console.print(f"[red]Invalid action:[/red] {e}")
+        return
+    execute_action(client, action)
+
+
+def cmd_sort(client: BalatroClient, args: list[str]):
+    """Sort the hand by rank or suit."""
+    mode = args[0] if args else "rank"
+    execute_action(client, ActionRequest(type=ActionType.SORT_HAND, params={"mode": mode}))
+
+
+def card_command(action_type: ActionType, usage: str, client: BalatroClient, args: list[str]):
+    """Execute a card action (select/play/discard) on the given card indices."""
+    indices = parse_indices(args)
+    if not indices:
+        console.print(f"[yellow]Usage: {usage}[/yellow]")
+        return
+    execute_action(client, ActionRequest(type=action_type, params={"card_indices": indices}))
+
+
+def index_command(
+    action_type: ActionType,
+    param: str,
+    usage: str,
+    error: str,
+    client: BalatroClient,
+    args: list[str],
+):
+    """Execute an action that takes a single integer parameter (slot or index)."""
+    if not args:
+        console.print(f"[yellow]Usage: {usage}[/yellow]")
+        return
+    try:
+        value = int(args[0])
+    except ValueError:
+        console.print(f"[red]{error}[/red]")
+        return
+    execute_action(client, ActionRequest(type=action_type, params={param: value}))
+
+
+def request_command(request: ActionRequest, client: BalatroClient, args: list[str]):
+    """Execute a prebuilt action with fixed parameters."""
+    execute_action(client, request)
+
+
+# Command name (and aliases) -> handler(client, args), built once so each
+# REPL line is a single dict lookup
+COMMANDS: dict[str, Callable[[BalatroClient, list[str]], None]] = {
+    "help": cmd_help,
+    "?": cmd_help,
+    "state": cmd_state,
+    "s": cmd_state,
+    "legal": cmd_legal,
+    "l": cmd_legal,
+    "observe": cmd_observe,
+    "o": cmd_observe,
+    "health": cmd_health,
+    "h": cmd_health,
+    "action": cmd_action,
+    "select": partial(card_command, ActionType.SELECT_CARDS, "select <index1> <index2> ..."),
+    "play": partial(card_command, ActionType.PLAY_HAND, "play <index1> <index2> ..."),
+    "discard": partial(card_command, ActionType.DISCARD, "discard <index1> <index2> ..."),
+    "run": partial(request_command, START_RUN_REQUEST),
+    "blind": partial(request_command, SELECT_BLIND_REQUEST),
+    "reroll": partial(request_command, SHOP_REROLL_REQUEST),
+    "endshop": partial(request_command, SHOP_END_REQUEST),
+    "sort": cmd_sort,
+}
+for _names, _command in (
+    (("buy", "buyjoker", "bj"),
+     partial(index_command, ActionType.SHOP_BUY, "slot", "buy <slot>", "Invalid slot number")),
+    (("buyvoucher", "bv"),
+     partial(index_command, ActionType.SHOP_BUY_VOUCHER, "slot", "buyvoucher <slot>", "Invalid slot number")),
+    (("buypack", "bp"),
+     partial(index_command, ActionType.SHOP_BUY_BOOSTER, "slot", "buypack <slot>", "Invalid slot number")),
+    (("skippack", "sp"), partial(request_command, SKIP_PACK_REQUEST)),
+    (("pick",),
+     partial(index_command, ActionType.SELECT_PACK_CARD, "index", "pick <index>", "Invalid index")),
+    (("use",),
+     partial(index_command, ActionType.USE_CONSUMABLE, "index", "use <index>", "Invalid index")),
+    (("sell",),
+     partial(index_command, ActionType.SHOP_SELL_JOKER, "joker_index", "sell <joker_index>", "Invalid joker index")),
+):
+    COMMANDS.update(dict.fromkeys(_names, _command))
+
+QUIT_COMMANDS = frozenset({"quit", "q", "exit"})
+
+
+def load_history():
+    """Load REPL history and save it again on exit (no-op without readline)."""
+    if readline is None:
+        return
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+    readline.set_history_length(HISTORY_LENGTH)
+    atexit.register(save_history)
+
+
+def save_history():
+    """Write REPL history, ignoring an unwritable home directory."""
+    try:
+        readline.write_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+
+
+def main(argv: list[str] | None = None, client: BalatroClient | None = None):
+    """Run the interactive shell.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        client: Client to reuse; when omitted, one is built from
+            --host/--port/--cache-ttl and closed on exit
+    """
     parser = argparse.ArgumentParser(description="Interactive Balatro shell")
     parser.add_argument("--host", default="127.0.0.1", help="Bridge host address")
     parser.add_argument("--port", type=int, default=7777, help="Bridge port number")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--cache-ttl", type=float, default=0.0,
+        help="Reuse state/legal fetched within this many seconds if no action was sent",
+    )
+    args = parser.parse_args(argv)
+
+    # One client for the whole session, so every command reuses its
+    # keep-alive connection
+    owns_client = client is None
+    if owns_client:
+        client = BalatroClient(host=args.host, port=args.port, cache_ttl=args.cache_ttl)
 
     console.print(Panel.fit(
-        f"Connecting to Balatro at {args.host}:{args.port}\n"
+        f"Connecting to Balatro at {client.host}:{client.port}\n"
         "Type 'help' for available commands",
         title="[bold blue]Balatro Interactive Shell[/bold blue]",
         border_style="blue"
     ))
 
     try:
-        client = BalatroClient(host=args.host, port=args.port)
-
         # Verify connection
         health = client.health()
         console.print(f"[green]Connected![/green] Bridge version: {health.version}")
 
     except BalatroConnectionError as e:
         console.print(f"[red]Failed to connect:[/red] {e}")
+        if owns_client:
+            client.close()
         sys.exit(1)
 
-    # REPL loop
+    load_history()
+
+    # REPL loop. Plain input() (with readline editing and history where
+    # available) rather than Rich's prompt, which restyles every turn
     while True:
         try:
-            cmd_input = Prompt.ask("\n[bold cyan]balatro>[/bold cyan]")
+            cmd_input = input("\nbalatro> ")
             cmd_parts = cmd_input.strip().split()
 
             if not cmd_parts:
@@ -132,198 +319,28 @@ def main():
             cmd = cmd_parts[0].lower()
             cmd_args = cmd_parts[1:]
 
-            if cmd in ("quit", "q", "exit"):
+            if cmd in QUIT_COMMANDS:
                 console.print("[yellow]Goodbye![/yellow]")
                 break
 
-            elif cmd in ("help", "?"):
-                console.print(HELP_TEXT)
-
-            elif cmd in ("state", "s"):
-                state = client.get_state()
-                print_state_summary(state)
-
-            elif cmd in ("legal", "l"):
-                legal = client.get_legal_actions()
-                print_legal_actions(legal)
-
-            elif cmd in ("health", "h"):
-                health = client.health()
-                console.print(f"Status: {health.status}")
-                console.print(f"Uptime: {health.uptime_ms / 1000:.1f}s")
-                console.print(f"Requests: {health.request_count}")
-
-            elif cmd == "action":
-                if not cmd_args:
-                    console.print("[yellow]Usage: action <json>[/yellow]")
-                    continue
-                try:
-                    json_str = " ".join(cmd_args)
-                    data = json.loads(json_str)
-                    action = ActionRequest(
-                        type=ActionType(data["type"]),
-                        params=data.get("params", {})
-                    )
-                    execute_action(client, action)
-                except json.JSONDecodeError as e:
-                    console.print(f"[red]Invalid JSON:[/red] {e}")
-                except (KeyError, ValueError) as e:
-                    console.print(f"[red]Invalid action:[/red] {e}")
-
-            elif cmd == "select":
-                indices = parse_indices(cmd_args)
-                if not indices:
-                    console.print("[yellow]Usage: select <index1> <index2> ...[/yellow]")
-                    continue
-                action = ActionRequest(
-                    type=ActionType.SELECT_CARDS,
-                    params={"card_indices": indices}
-                )
-                execute_action(client, action)
-
-            elif cmd == "play":
-                indices = parse_indices(cmd_args)
-                if not indices:
-                    console.print("[yellow]Usage: play <index1> <index2> ...[/yellow]")
-                    continue
-                action = ActionRequest(
-                    type=ActionType.PLAY_HAND,
-                    params={"card_indices": indices}
-                )
-                execute_action(client, action)
-
-            elif cmd == "discard":
-                indices = parse_indices(cmd_args)
-                if not indices:
-                    console.print("[yellow]Usage: discard <index1> <index2> ...[/yellow]")
-                    continue
-                action = ActionRequest(
-                    type=ActionType.DISCARD,
-                    params={"card_indices": indices}
-                )
-                execute_action(client, action)
-
-            elif cmd == "run":
-                execute_action(client, ActionRequest(
-                    type=ActionType.START_RUN, params={"stake": 1}
-                ))
-
-            elif cmd == "blind":
-                execute_action(client, ActionRequest(
-                    type=ActionType.SELECT_BLIND, params={}
-                ))
-
-            elif cmd == "reroll":
-                execute_action(client, ActionRequest(type=ActionType.SHOP_REROLL))
-
-            elif cmd == "endshop":
-                execute_action(client, ActionRequest(type=ActionType.SHOP_END))
-
-            elif cmd == "sort":
-                mode = cmd_args[0] if cmd_args else "rank"
-                action = ActionRequest(
-                    type=ActionType.SORT_HAND,
-                    params={"mode": mode}
-                )
-                execute_action(client, action)
-
-            elif cmd in ("buy", "buyjoker", "bj"):
-                if not cmd_args:
-                    console.print("[yellow]Usage: buy <slot>[/yellow]")
-                    continue
-                try:
-                    slot = int(cmd_args[0])
-                    action = ActionRequest(
-                        type=ActionType.SHOP_BUY,
-                        params={"slot": slot}
-                    )
-                    execute_action(client, action)
-                except ValueError:
-                    console.print("[red]Invalid slot number[/red]")
-
-            elif cmd in ("buyvoucher", "bv"):
-                if not cmd_args:
-                    console.print("[yellow]Usage: buyvoucher <slot>[/yellow]")
-                    continue
-                try:
-                    slot = int(cmd_args[0])
-                    action = ActionRequest(
-                        type=ActionType.SHOP_BUY_VOUCHER,
-                        params={"slot": slot}
-                    )
-                    execute_action(client, action)
-                except ValueError:
-                    console.print("[red]Invalid slot number[/red]")
-
-            elif cmd in ("buypack", "bp"):
-                if not cmd_args:
-                    console.print("[yellow]Usage: buypack <slot>[/yellow]")
-                    continue
-                try:
-                    slot = int(cmd_args[0])
-                    action = ActionRequest(
-                        type=ActionType.SHOP_BUY_BOOSTER,
-                        params={"slot": slot}
-                    )
-                    execute_action(client, action)
-                except ValueError:
-                    console.print("[red]Invalid slot number[/red]")
-
-            elif cmd == "pick":
-                if not cmd_args:
-                    console.print("[yellow]Usage: pick <index>[/yellow]")
-                    continue
-                try:
-                    idx = int(cmd_args[0])
-                    action = ActionRequest(
-                        type=ActionType.SELECT_PACK_CARD,
-                        params={"index": idx}
-                    )
-                    execute_action(client, action)
-                except ValueError:
-                    console.print("[red]Invalid index[/red]")
-
-            elif cmd in ("skippack", "sp"):
-                execute_action(client, ActionRequest(type=ActionType.SKIP_PACK))
-
-            elif cmd == "use":
-                if not cmd_args:
-                    console.print("[yellow]Usage: use <index>[/yellow]")
-                    continue
-                try:
-                    idx = int(cmd_args[0])
-                    action = ActionRequest(
-                        type=ActionType.USE_CONSUMABLE,
-                        params={"index": idx}
-                    )
-                    execute_action(client, action)
-                except ValueError:
-                    console.print("[red]Invalid index[/red]")
-
-            elif cmd == "sell":
-                if not cmd_args:
-                    console.print("[yellow]Usage: sell <joker_index>[/yellow]")
-                    continue
-                try:
-                    idx = int(cmd_args[0])
-                    action = ActionRequest(
-                        type=ActionType.SHOP_SELL_JOKER,
-                        params={"joker_index": idx}
-                    )
-                    execute_action(client, action)
-                except ValueError:
-                    console.print("[red]Invalid joker index[/red]")
-
-            else:
+            handler = COMMANDS.get(cmd)
+            if handler is None:
                 console.print(f"[yellow]Unknown command: {cmd}[/yellow]")
                 console.print("Type 'help' for available commands")
+                continue
+
+            handler(client, cmd_args)
 
+        except BalatroConnectionError as e:
+            # Keep the session (and client) alive across a transient bridge error
+            console.print(f"[red]Connection error:[/red] {e}")
         except KeyboardInterrupt:
             console.print("\n[yellow]Use 'quit' to exit[/yellow]")
         except EOFError:
             break
 
-    client.close()
+    if owns_client:
+        client.close()
 
 
 if __name__ == "__main__":
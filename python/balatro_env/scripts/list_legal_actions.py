@@ -18,16 +18,25 @@ from balatro_env.util import print_legal_actions, save_legal_artifact
 console = Console()
 
 
-def main():
+def main(argv: list[str] | None = None, client: BalatroClient | None = None):
+    """List the current legal actions.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        client: Client to reuse; when omitted, one is built from
+            --host/--port and closed on exit
+    """
     parser = argparse.ArgumentParser(description="List legal actions in Balatro")
     parser.add_argument("--host", default="127.0.0.1", help="Bridge host address")
     parser.add_argument("--port", type=int, default=7777, help="Bridge port number")
     parser.add_argument("--output", default="artifacts", help="Output directory for JSON")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    try:
+    owns_client = client is None
+    if owns_client:
         client = BalatroClient(host=args.host, port=args.port)
-        console.print(f"Fetching legal actions from {args.host}:{args.port}...")
+    try:
+        console.print(f"Fetching legal actions from {client.host}:{client.port}...")
 
         legal = client.get_legal_actions()
 
@@ -42,23 +51,23 @@ def main():
 
         # Summary by type
         console.print(f"\n[bold]Action Type Summary:[/bold]")
-        action_types = {}
-        for action in legal.actions:
-            t = action.type.value
-            action_types[t] = action_types.get(t, 0) + 1
+        action_types = {t.value: len(actions) for t, actions in legal.by_type.items()}
 
         for t, count in sorted(action_types.items()):
             console.print(f"  {t}: {count}")
 
         console.print(f"\n[bold]Total legal actions:[/bold] {len(legal.actions)}")
 
-        client.close()
         sys.exit(0)
 
     except BalatroConnectionError as e:
         console.print(f"[red]Connection error:[/red] {e}")
         sys.exit(1)
 
+    finally:
+        if owns_client:
+            client.close()
+
 
 if __name__ == "__main__":
     main()
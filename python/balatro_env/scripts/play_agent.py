@@ -31,8 +31,19 @@ from rich.text import Text
 
 from balatro_env.client import BalatroClient, BalatroConnectionError
 from balatro_env.schemas import (
-    ActionRequest, ActionType, CardData, GamePhase, GameState, LegalActions
+    CASH_OUT_REQUEST,
+    SELECT_BLIND_REQUEST,
+    SHOP_END_REQUEST,
+    SHOP_REROLL_REQUEST,
+    START_RUN_REQUEST,
+    ActionRequest,
+    ActionType,
+    CardData,
+    GamePhase,
+    GameState,
+    LegalActions,
 )
+from balatro_env.strategy import _SUIT_LETTERS
 from balatro_env.util import print_state_summary
 
 console = Console()
@@ -502,7 +513,7 @@ def choose_shop_action(state: GameState, legal: LegalActions,
     """One step of shop logic - buy best available or end."""
     shop = state.shop
     if not shop:
-        return ActionRequest(type=ActionType.SHOP_END)
+        return SHOP_END_REQUEST
 
     money = state.money
     joker_count = len(state.jokers)
@@ -599,9 +610,9 @@ def choose_shop_action(state: GameState, legal: LegalActions,
         cheap_reroll = rc <= 5 and money >= rc + 6
         if no_jokers_reroll or cheap_reroll:
             console.print(f"  -> Reroll (cost ${rc})")
-            return ActionRequest(type=ActionType.SHOP_REROLL)
+            return SHOP_REROLL_REQUEST
 
-    return ActionRequest(type=ActionType.SHOP_END)
+    return SHOP_END_REQUEST
 
 
 # -- Consumable use decisions --------------------------------------------------
@@ -962,8 +973,7 @@ def _card_label(card) -> str:
     else:
         r = card.rank or "?"
         s = card.suit or "?"
-    suit_sym = {"Hearts": "H", "Diamonds": "D", "Clubs": "C", "Spades": "S"}
-    return f"{r}{suit_sym.get(str(s), '?')}"
+    return f"{r}{_SUIT_LETTERS.get(str(s), '?')}"
 
 
 LOG_MAX = 30
@@ -1170,8 +1180,7 @@ def run_agent(client: BalatroClient, tui: bool = False, delay: float = 0.8):
         while True:
             # -- fetch state ------------------------------------------------
             try:
-                state  = client.get_state()
-                legal  = client.get_legal_actions()
+                state, legal = client.get_observation()
             except BalatroConnectionError as e:
                 tui_log(f"[red]Connection error: {e} - retrying[/red]")
                 time.sleep(1.0)
@@ -1225,8 +1234,7 @@ def run_agent(client: BalatroClient, tui: bool = False, delay: float = 0.8):
 
             # -- MENU ------------------------------------------------------
             if phase == GamePhase.MENU:
-                r = client.execute_action(
-                    ActionRequest(type=ActionType.START_RUN, params={"stake": 1}))
+                r = client.execute_action(START_RUN_REQUEST)
                 if r.ok:
                     tui_log("[green]  Run started[/green]")
                     time.sleep(3.0)
@@ -1237,8 +1245,7 @@ def run_agent(client: BalatroClient, tui: bool = False, delay: float = 0.8):
             # -- BLIND SELECT ----------------------------------------------
             elif phase == GamePhase.BLIND_SELECT:
                 if legal.has_action_type(ActionType.SELECT_BLIND):
-                    r = client.execute_action(
-                        ActionRequest(type=ActionType.SELECT_BLIND, params={}))
+                    r = client.execute_action(SELECT_BLIND_REQUEST)
                     if r.ok:
                         tui_log("[green]  Blind selected[/green]")
                         time.sleep(1.5)
@@ -1344,8 +1351,7 @@ def run_agent(client: BalatroClient, tui: bool = False, delay: float = 0.8):
             # -- ROUND EVAL ------------------------------------------------
             elif phase == GamePhase.ROUND_EVAL:
                 for _ in range(15):
-                    r = client.execute_action(
-                        ActionRequest(type=ActionType.CASH_OUT, params={}))
+                    r = client.execute_action(CASH_OUT_REQUEST)
                     if r.ok:
                         tui_log("[green]  Cashed out[/green]")
                         time.sleep(1.0)
@@ -1390,7 +1396,7 @@ def run_agent(client: BalatroClient, tui: bool = False, delay: float = 0.8):
                         failed_shop_slots.add((action.type, slot))
                         time.sleep(0.5)
                     else:
-                        client.execute_action(ActionRequest(type=ActionType.SHOP_END))
+                        client.execute_action(SHOP_END_REQUEST)
                         time.sleep(1.0)
 
             # -- PACK OPENING ----------------------------------------------
@@ -1427,8 +1433,7 @@ def run_agent(client: BalatroClient, tui: bool = False, delay: float = 0.8):
                 if tui:
                     session.finish_run(won=False)
                 time.sleep(4.0)
-                r = client.execute_action(
-                    ActionRequest(type=ActionType.START_RUN, params={"stake": 1}))
+                r = client.execute_action(START_RUN_REQUEST)
                 if r.ok:
                     tui_log("[green]  New run started[/green]")
                     time.sleep(3.0)
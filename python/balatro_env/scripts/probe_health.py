@@ -2,51 +2,97 @@
 """Probe the Balatro RL Bridge health endpoint.
 
 Usage:
-    python -m balatro_env.scripts.probe_health [--host HOST] [--port PORT]
+    python -m balatro_env.scripts.probe_health [--host HOST] [--port PORT] [--quiet | --fast]
 
-Returns exit code 0 if healthy, 1 otherwise.
+Returns exit code 0 if healthy, 1 otherwise. With --quiet, prints a single
+plain-text line and skips loading Rich, for use in tight health-check loops.
+--fast prints the same line using only the standard library (no client,
+pydantic or Rich), like `curl http://127.0.0.1:7777/health`.
 """
 
 import argparse
 import sys
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.panel import Panel
+if TYPE_CHECKING:
+    from balatro_env.client import BalatroClient
 
-from balatro_env.client import BalatroClient, BalatroConnectionError
 
-console = Console()
+def format_status(status: str, version: str, uptime_ms: float) -> str:
+    """Format the one-line status printed by --quiet and --fast."""
+    return f"{status} v{version} up={uptime_ms / 1000:.1f}s"
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Probe Balatro RL Bridge health")
-    parser.add_argument("--host", default="127.0.0.1", help="Bridge host address")
-    parser.add_argument("--port", type=int, default=7777, help="Bridge port number")
-    parser.add_argument("--timeout", type=float, default=5.0, help="Connection timeout")
-    args = parser.parse_args()
+def probe_fast(host: str, port: int, timeout: float) -> int:
+    """Probe /health with a single stdlib HTTP request.
 
-    console.print(f"Connecting to Balatro RL Bridge at {args.host}:{args.port}...")
+    Args:
+        host: Bridge host address
+        port: Bridge port number
+        timeout: Connection timeout in seconds
+
+    Returns:
+        Process exit code
+    """
+    import http.client
+    import json
+
+    conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        conn.request("GET", "/health")
+        response = conn.getresponse()
+        if response.status >= 400:
+            raise http.client.HTTPException(f"HTTP error: {response.status} {response.reason}")
+        health = json.loads(response.read())
+    except (OSError, http.client.HTTPException, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+    print(format_status(health.get("status"), health.get("version"), health.get("uptime_ms", 0)))
+    return 0
+
+
+def probe_quiet(client: "BalatroClient") -> int:
+    """Probe health through BalatroClient with one line of plain output.
+
+    Args:
+        client: Client to probe with
+
+    Returns:
+        Process exit code
+    """
+    from balatro_env.client import BalatroConnectionError
 
     try:
-        client = BalatroClient(host=args.host, port=args.port, timeout=args.timeout)
         health = client.health()
+    except BalatroConnectionError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(format_status(health.status, health.version, health.uptime_ms))
+    return 0
 
-        console.print(Panel.fit(
-            f"[bold green]Status:[/bold green] {health.status}\n"
-            f"[bold]Version:[/bold] {health.version}\n"
-            f"[bold]Uptime:[/bold] {health.uptime_ms / 1000:.1f}s\n"
-            f"[bold]Requests:[/bold] {health.request_count}\n"
-            f"[bold]Errors:[/bold] {health.error_count}",
-            title="[green]Bridge Health[/green]",
-            border_style="green"
-        ))
 
-        if health.last_error:
-            console.print(f"[yellow]Last Error:[/yellow] {health.last_error}")
+def probe_full(client: "BalatroClient") -> int:
+    """Probe health and print a full Rich report, with troubleshooting on failure.
+
+    Args:
+        client: Client to probe with
+
+    Returns:
+        Process exit code
+    """
+    # Rich is only needed (and only imported) for the full report
+    from rich.console import Console
+    from rich.panel import Panel
+
+    from balatro_env.client import BalatroConnectionError
 
-        client.close()
-        sys.exit(0)
+    console = Console()
+    console.print(f"Connecting to Balatro RL Bridge at {client.host}:{client.port}...")
 
+    try:
+        health = client.health()
     except BalatroConnectionError as e:
         console.print(Panel.fit(
             f"[bold red]Connection Failed[/bold red]\n\n{e}",
@@ -57,7 +103,58 @@ def main():
         console.print("1. Is Balatro running with the RL Bridge mod?")
         console.print("2. Check terminal output for mod loading messages")
         console.print("3. Try: curl http://127.0.0.1:7777/health")
-        sys.exit(1)
+        return 1
+
+    console.print(Panel.fit(
+        f"[bold green]Status:[/bold green] {health.status}\n"
+        f"[bold]Version:[/bold] {health.version}\n"
+        f"[bold]Uptime:[/bold] {health.uptime_ms / 1000:.1f}s\n"
+        f"[bold]Requests:[/bold] {health.request_count}\n"
+        f"[bold]Errors:[/bold] {health.error_count}",
+        title="[green]Bridge Health[/green]",
+        border_style="green"
+    ))
+
+    if health.last_error:
+        console.print(f"[yellow]Last Error:[/yellow] {health.last_error}")
+
+    return 0
+
+
+def main(argv: list[str] | None = None, client: "BalatroClient | None" = None):
+    """Run the health probe.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        client: Client to reuse; when omitted, one is built from
+            --host/--port/--timeout and closed on exit
+    """
+    parser = argparse.ArgumentParser(description="Probe Balatro RL Bridge health")
+    parser.add_argument("--host", default="127.0.0.1", help="Bridge host address")
+    parser.add_argument("--port", type=int, default=7777, help="Bridge port number")
+    parser.add_argument("--timeout", type=float, default=5.0, help="Connection timeout")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--quiet", action="store_true", help="Print a single plain-text status line")
+    mode.add_argument(
+        "--fast", action="store_true",
+        help="Like --quiet, but with a stdlib-only request (no client, pydantic or Rich)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.fast:
+        host, port = (client.host, client.port) if client else (args.host, args.port)
+        sys.exit(probe_fast(host, port, args.timeout))
+
+    from balatro_env.client import BalatroClient
+
+    owns_client = client is None
+    if owns_client:
+        client = BalatroClient(host=args.host, port=args.port, timeout=args.timeout)
+    try:
+        sys.exit(probe_quiet(client) if args.quiet else probe_full(client))
+    finally:
+        if owns_client:
+            client.close()
 
 
 if __name__ == "__main__":
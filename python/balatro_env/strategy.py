@@ -54,11 +54,13 @@ def card_index(card: CardData | dict) -> int:
     return card.hand_index or card.area_index or 0
 
 
+_SUIT_LETTERS = {"Hearts": "H", "Diamonds": "D", "Clubs": "C", "Spades": "S"}
+
+
 def card_label(card: CardData | dict) -> str:
     r = card.get("rank") if isinstance(card, dict) else card.rank
     s = card.get("suit") if isinstance(card, dict) else card.suit
-    suit_sym = {"Hearts": "H", "Diamonds": "D", "Clubs": "C", "Spades": "S"}
-    return f"{r}{suit_sym.get(s or '', '?')}"
+    return f"{r}{_SUIT_LETTERS.get(s or '', '?')}"
 
 
 # ---------------------------------------------------------------------------
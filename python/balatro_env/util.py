@@ -1,18 +1,32 @@
 """Utility functions for the Balatro RL environment."""
 
-import json
+import atexit
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, BinaryIO
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+import orjson
 
 from balatro_env.schemas import CardData, GamePhase, GameState, JokerData, LegalActions
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+
+# Rich is only imported, and the Console (with its terminal probe) only
+# built, once something is printed; headless callers that just save
+# artifacts never pay for either
+@lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """Return the shared Rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+_SUIT_SYMBOLS = {"Hearts": "♥", "Diamonds": "♦", "Clubs": "♣", "Spades": "♠"}
 
 
 def format_card(card: CardData) -> str:
@@ -24,11 +38,15 @@ def format_card(card: CardData) -> str:
     Returns:
         Formatted card string
     """
-    suit_symbols = {"Hearts": "♥", "Diamonds": "♦", "Clubs": "♣", "Spades": "♠"}
-    suit = suit_symbols.get(card.suit, card.suit or "?")
+    suit = _SUIT_SYMBOLS.get(card.suit, card.suit or "?")
     rank = card.rank or "?"
+    base = f"{rank}{suit}"
+
+    # Most cards have no modifiers
+    if not (card.edition or card.enhancement or card.seal or card.debuffed or card.highlighted):
+        return base
 
-    parts = [f"{rank}{suit}"]
+    parts = [base]
 
     if card.edition:
         parts.append(f"[{card.edition}]")
@@ -54,6 +72,9 @@ def format_joker(joker: JokerData) -> str:
         Formatted joker string
     """
     name = joker.name or joker.key or "Unknown"
+    if not (joker.edition or joker.sell_cost):
+        return name
+
     parts = [name]
 
     if joker.edition:
@@ -70,11 +91,23 @@ def print_state_summary(state: GameState):
     Args:
         state: Game state to display
     """
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    # Sections are collected and printed as one Group, a single render pass
+    renderables = []
+
     # Phase and run info
-    console.print(Panel.fit(
-        f"[bold]Phase:[/bold] {state.phase.value}\n"
-        f"[bold]Run ID:[/bold] {state.run_id or 'N/A'}\n"
-        f"[bold]Ante:[/bold] {state.ante}  [bold]Round:[/bold] {state.round}",
+    # Panel text is assembled from styled spans rather than markup, so Rich
+    # doesn't have to parse it on every render
+    renderables.append(Panel.fit(
+        Text.assemble(
+            ("Phase:", "bold"), f" {state.phase.value}\n",
+            ("Run ID:", "bold"), f" {state.run_id or 'N/A'}\n",
+            ("Ante:", "bold"), f" {state.ante}  ", ("Round:", "bold"), f" {state.round}",
+        ),
         title="Game State"
     ))
 
@@ -87,7 +120,7 @@ def print_state_summary(state: GameState):
     resources.add_row("Discards Left", str(state.discards_remaining))
     resources.add_row("Deck Size", str(state.deck_counts.deck_size))
     resources.add_row("Discard Pile", str(state.deck_counts.discard_size))
-    console.print(resources)
+    renderables.append(resources)
 
     # Blind info
     if state.blind:
@@ -99,7 +132,7 @@ def print_state_summary(state: GameState):
         blind_table.add_row("Chips Scored", f"{state.blind.chips_scored:,}")
         if state.blind.boss:
             blind_table.add_row("Boss Effect", state.blind.debuff_text or "Yes")
-        console.print(blind_table)
+        renderables.append(blind_table)
 
     # Hand
     if state.hand:
@@ -108,19 +141,15 @@ def print_state_summary(state: GameState):
         hand_table.add_column("Card", style="bold")
         hand_table.add_column("Extras", style="cyan")
         for card in state.hand:
-            extras = []
-            if card.edition:
-                extras.append(card.edition)
-            if card.enhancement:
-                extras.append(card.enhancement)
-            if card.seal:
-                extras.append(card.seal)
+            extras = ", ".join(
+                extra for extra in (card.edition, card.enhancement, card.seal) if extra
+            )
             hand_table.add_row(
                 str(card.hand_index or "?"),
                 format_card(card),
-                ", ".join(extras) if extras else "-"
+                extras or "-"
             )
-        console.print(hand_table)
+        renderables.append(hand_table)
 
     # Jokers
     if state.jokers:
@@ -134,7 +163,7 @@ def print_state_summary(state: GameState):
                 joker.name or joker.key or "Unknown",
                 f"${joker.sell_cost}"
             )
-        console.print(joker_table)
+        renderables.append(joker_table)
 
     # Consumables
     if state.consumables:
@@ -150,7 +179,7 @@ def print_state_summary(state: GameState):
                 cons.type or "?",
                 "Yes" if cons.can_use else "No"
             )
-        console.print(cons_table)
+        renderables.append(cons_table)
 
     # Shop (three separate areas)
     if state.shop:
@@ -169,7 +198,7 @@ def print_state_summary(state: GameState):
                     f"${item.cost} [{affordable}]",
                     item.type
                 )
-            console.print(jt)
+            renderables.append(jt)
 
         if shop.vouchers:
             vt = Table(title="Shop - Vouchers")
@@ -183,7 +212,7 @@ def print_state_summary(state: GameState):
                     item.name or item.key or "Unknown",
                     f"${item.cost} [{affordable}]"
                 )
-            console.print(vt)
+            renderables.append(vt)
 
         if shop.boosters:
             bt = Table(title="Shop - Booster Packs")
@@ -197,10 +226,10 @@ def print_state_summary(state: GameState):
                     item.name or item.key or "Unknown",
                     f"${item.cost} [{affordable}]"
                 )
-            console.print(bt)
+            renderables.append(bt)
 
         if not shop.jokers and not shop.vouchers and not shop.boosters:
-            console.print(f"[dim]Shop is empty (Reroll: ${shop.reroll_cost})[/dim]")
+            renderables.append(f"[dim]Shop is empty (Reroll: ${shop.reroll_cost})[/dim]")
 
     # Pack
     if state.pack and state.pack.cards:
@@ -215,7 +244,9 @@ def print_state_summary(state: GameState):
             if card.get("suit") and card.get("rank"):
                 name = f"{card['rank']} of {card['suit']}"
             pack_table.add_row(str(card.get("index", "?")), name, card_type)
-        console.print(pack_table)
+        renderables.append(pack_table)
+
+    _get_console().print(Group(*renderables))
 
 
 def print_legal_actions(legal: LegalActions):
@@ -224,38 +255,61 @@ def print_legal_actions(legal: LegalActions):
     Args:
         legal: Legal actions to display
     """
-    console.print(Panel.fit(
-        f"[bold]Phase:[/bold] {legal.phase.value}\n"
-        f"[bold]Actions Available:[/bold] {len(legal.actions)}",
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    renderables = [Panel.fit(
+        Text.assemble(
+            ("Phase:", "bold"), f" {legal.phase.value}\n",
+            ("Actions Available:", "bold"), f" {len(legal.actions)}",
+        ),
         title="Legal Actions"
-    ))
+    )]
 
-    # Group actions by type
-    by_type: dict[str, list] = {}
-    for action in legal.actions:
-        action_type = action.type.value
-        if action_type not in by_type:
-            by_type[action_type] = []
-        by_type[action_type].append(action)
-
-    for action_type, actions in by_type.items():
-        action_table = Table(title=action_type)
+    for action_type, actions in legal.by_type.items():
+        action_table = Table(title=action_type.value)
         action_table.add_column("Description", style="cyan")
         action_table.add_column("Params", style="yellow")
 
-        for action in actions[:5]:  # Limit display
+        for action in islice(actions, 5):  # Limit display, without copying the list
             params_str = ""
             if action.params:
-                params_dict = action.params.model_dump(exclude_none=True)
+                params_dict = action.params.model_dump(mode="json", exclude_none=True)
                 if params_dict:
-                    params_str = json.dumps(params_dict, default=str)[:50]
+                    # Decoded before truncating so a multi-byte character isn't split
+                    params_str = orjson.dumps(params_dict).decode()[:50]
 
             action_table.add_row(action.description, params_str)
 
         if len(actions) > 5:
             action_table.add_row(f"... and {len(actions) - 5} more", "")
 
-        console.print(action_table)
+        renderables.append(action_table)
+
+    _get_console().print(Group(*renderables))
+
+
+# Absolute artifact directories already created by this process, so repeated
+# saves skip the mkdir syscall (directories are assumed not to be removed
+# mid-run). Absolute, so a relative directory still gets created after a chdir.
+_created_dirs: set[Path] = set()
+
+
+def _artifact_path(output_dir: Path | str, prefix: str) -> Path:
+    """Build a unique, time-sortable artifact path, creating the directory.
+
+    Microseconds in the name keep artifacts saved within the same second
+    from overwriting each other.
+    """
+    output_dir = Path(output_dir).absolute()
+    if output_dir not in _created_dirs:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(output_dir)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return output_dir / f"{prefix}_{timestamp}.json"
 
 
 def save_state_artifact(state: GameState, output_dir: Path | str = "artifacts") -> Path:
@@ -268,15 +322,12 @@ def save_state_artifact(state: GameState, output_dir: Path | str = "artifacts")
     Returns:
         Path to saved file
     """
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"state_{timestamp}.json"
-    filepath = output_dir / filename
+    filepath = _artifact_path(output_dir, "state")
 
-    with open(filepath, "w") as f:
-        json.dump(state.model_dump(), f, indent=2, default=str)
+    # Serialized directly by pydantic-core, without an intermediate dict.
+    # Written as UTF-8 bytes; write_text would use the locale codec (cp1252
+    # on Windows) and fail on names outside it.
+    filepath.write_bytes(state.model_dump_json(indent=2).encode())
 
     return filepath
 
@@ -291,14 +342,53 @@ def save_legal_artifact(legal: LegalActions, output_dir: Path | str = "artifacts
     Returns:
         Path to saved file
     """
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    filepath = _artifact_path(output_dir, "legal")
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"legal_{timestamp}.json"
-    filepath = output_dir / filename
-
-    with open(filepath, "w") as f:
-        json.dump(legal.model_dump(), f, indent=2, default=str)
+    # Serialized directly by pydantic-core, without an intermediate dict.
+    # Written as UTF-8 bytes; write_text would use the locale codec (cp1252
+    # on Windows) and fail on names outside it.
+    filepath.write_bytes(legal.model_dump_json(indent=2).encode())
 
     return filepath
+
+
+# Open NDJSON streams by resolved path, kept open so each append is a single
+# write rather than an open/close per record
+_ndjson_files: dict[Path, BinaryIO] = {}
+
+
+def save_state_ndjson(state: GameState, path: Path | str = "artifacts/states.ndjson") -> Path:
+    """Append game state as one line to an NDJSON artifact file.
+
+    Meant for long runs, where one file per state would leave thousands of
+    small files behind. Each record is flushed as it is written, so a killed
+    run keeps every state saved so far. Streams stay open until
+    close_ndjson_streams() or interpreter exit.
+
+    Args:
+        state: Game state to save
+        path: NDJSON file to append to
+
+    Returns:
+        Resolved path to the NDJSON file
+    """
+    # Resolved, so a relative path keeps meaning the same file after a chdir
+    # and differently spelled paths to one file share a stream
+    path = Path(path).resolve()
+    stream = _ndjson_files.get(path)
+    if stream is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stream = _ndjson_files[path] = path.open("ab")
+
+    stream.write(state.model_dump_json().encode() + b"\n")
+    stream.flush()
+
+    return path
+
+
+@atexit.register
+def close_ndjson_streams():
+    """Flush and close all NDJSON streams opened by save_state_ndjson()."""
+    while _ndjson_files:
+        _, stream = _ndjson_files.popitem()
+        stream.close()
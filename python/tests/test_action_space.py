@@ -0,0 +1,139 @@
+"""Tests for action space encoding and decoding.
+
+These are offline unit tests and do not require the game to be running.
+
+Run with: pytest tests/test_action_space.py -v
+"""
+
+import numpy as np
+import pytest
+
+from balatro_env.action_space import ActionEncoder
+from balatro_env.schemas import ActionRequest, ActionType, LegalActions
+
+
+@pytest.fixture
+def encoder():
+    """Create an encoder instance."""
+    return ActionEncoder()
+
+
+class TestBitmapConversion:
+    """Tests for card index <-> bitmap conversion."""
+
+    def test_indices_to_bitmap(self, encoder):
+        """Indices should map to their bit positions."""
+        assert encoder.card_indices_to_bitmap([]) == 0
+        assert encoder.card_indices_to_bitmap([1]) == 0b1
+        assert encoder.card_indices_to_bitmap([1, 3, 10]) == 0b1000000101
+
+    def test_unsorted_and_out_of_range_indices(self, encoder):
+        """Order, duplicates and out-of-range indices should not matter."""
+        assert encoder.card_indices_to_bitmap([3, 1, 3]) == 0b101
+        assert encoder.card_indices_to_bitmap([0, 2, 11]) == 0b10
+
+    def test_round_trip(self, encoder):
+        """Every bitmap should survive a round trip through indices."""
+        for bitmap in range(1 << encoder.MAX_HAND_SIZE):
+            indices = encoder.bitmap_to_card_indices(bitmap)
+            assert list(indices) == sorted(indices)
+            assert encoder.card_indices_to_bitmap(indices) == bitmap
+
+
+class TestEncodeDecode:
+    """Tests for action index encoding and decoding."""
+
+    def test_decode_encode_round_trip(self, encoder):
+        """Every action index should decode to a request that encodes back to it."""
+        for action_idx in range(encoder.get_action_space_size()):
+            if 6 <= action_idx < encoder.play_hand_offset:
+                continue  # Reserved simple-action slots
+            action = encoder.decode_action(action_idx)
+            assert encoder.encode_action(action) == action_idx
+
+    def test_encode_play_hand(self, encoder):
+        """PLAY_HAND should encode to the offset plus the card bitmap."""
+        action = ActionRequest(type=ActionType.PLAY_HAND, params={"card_indices": [1, 2]})
+        assert encoder.encode_action(action) == encoder.play_hand_offset + 0b11
+
+    def test_decode_invalid_index(self, encoder):
+        """Out-of-range and reserved indices should raise ValueError."""
+        for action_idx in (-1, 6, encoder.play_hand_offset - 1, encoder.get_action_space_size()):
+            with pytest.raises(ValueError):
+                encoder.decode_action(action_idx)
+
+
+class TestLegalActionMask:
+    """Tests for legal action mask generation."""
+
+    def test_card_selection_mask(self, encoder):
+        """PLAY_HAND should mark every selection of allowed size from available cards."""
+        legal = LegalActions.model_validate({
+            "schema_version": "1.0.0",
+            "phase": "SELECTING_HAND",
+            "actions": [{
+                "type": "PLAY_HAND",
+                "description": "Play selected cards",
+                "params": {"card_indices": {"available": [1, 2, 4], "min_select": 1, "max_select": 2}},
+            }],
+        })
+        mask = encoder.get_legal_action_mask(legal)
+        legal_bitmaps = {i - encoder.play_hand_offset for i, is_legal in enumerate(mask) if is_legal}
+        assert legal_bitmaps == {0b1, 0b10, 0b1000, 0b11, 0b1001, 0b1010}
+
+    def test_simple_action_mask(self, encoder):
+        """Simple actions should mark only their own index."""
+        legal = LegalActions.model_validate({
+            "schema_version": "1.0.0",
+            "phase": "SHOP",
+            "actions": [{"type": "SHOP_END", "description": "Leave shop"}],
+        })
+        mask = encoder.get_legal_action_mask(legal)
+        assert [i for i, is_legal in enumerate(mask) if is_legal] == [encoder.simple_actions["SHOP_END"]]
+
+    def test_batched_masks_match_single_masks(self, encoder):
+        """Batched masks should equal the per-environment masks row by row."""
+        shop = LegalActions.model_validate({
+            "schema_version": "1.0.0",
+            "phase": "SHOP",
+            "actions": [{"type": "SHOP_END", "description": "Leave shop"}],
+        })
+        hand = LegalActions.model_validate({
+            "schema_version": "1.0.0",
+            "phase": "SELECTING_HAND",
+            "actions": [{
+                "type": "DISCARD",
+                "description": "Discard selected cards",
+                "params": {"card_indices": {"min_select": 1, "max_select": 5}},
+            }],
+        })
+        masks = encoder.get_legal_action_masks([shop, hand], [8, 6])
+        assert masks.shape == (2, encoder.get_action_space_size())
+        assert (masks[0] == encoder.get_legal_action_mask(shop, 8)).all()
+        assert (masks[1] == encoder.get_legal_action_mask(hand, 6)).all()
+
+        with pytest.raises(ValueError):
+            encoder.get_legal_action_masks([shop, hand], [8])
+
+    def test_mask_is_memoized_per_legal_actions(self, encoder):
+        """The same LegalActions object should reuse its read-only mask."""
+        legal = LegalActions.model_validate({
+            "schema_version": "1.0.0",
+            "phase": "BLIND_SELECT",
+            "actions": [{"type": "SELECT_BLIND", "description": "Select blind"}],
+        })
+        mask = encoder.get_legal_action_mask(legal)
+        assert encoder.get_legal_action_mask(legal) is mask
+        assert encoder.get_legal_action_mask(legal, hand_size=5) is not mask
+        assert not mask.flags.writeable
+
+    def test_fill_into_buffer(self, encoder):
+        """Filling a reused buffer should clear stale entries and match the mask."""
+        legal = LegalActions.model_validate({
+            "schema_version": "1.0.0",
+            "phase": "SHOP",
+            "actions": [{"type": "SHOP_END", "description": "Leave shop"}],
+        })
+        out = np.ones(encoder.get_action_space_size(), dtype=np.bool_)
+        encoder.fill_legal_action_mask(legal, 8, out)
+        assert (out == encoder.get_legal_action_mask(legal, 8)).all()
@@ -0,0 +1,121 @@
+"""Tests for the client's observation cache.
+
+These are offline unit tests and do not require the game to be running;
+the HTTP layer is replaced by a stub that serves canned responses.
+
+Run with: pytest tests/test_client.py -v
+"""
+
+import orjson
+import pytest
+
+from balatro_env.client import BalatroClient
+from balatro_env.schemas import SHOP_END_REQUEST
+
+
+def make_state(money: int) -> dict:
+    """Build a minimal game state payload."""
+    return {"schema_version": "1.0.0", "timestamp_ms": 0, "phase": "SHOP", "money": money}
+
+
+LEGAL = {
+    "schema_version": "1.0.0",
+    "phase": "SHOP",
+    "actions": [{"type": "SHOP_END", "description": "Leave shop"}],
+}
+
+
+class StubBridge:
+    """Stands in for BalatroClient._request_raw, counting calls per endpoint."""
+
+    def __init__(self):
+        self.money = 10
+        self.calls: list[str] = []
+
+    def __call__(self, method: str, endpoint: str, body: bytes | None = None) -> bytes:
+        self.calls.append(endpoint)
+        if endpoint == "state":
+            payload = make_state(self.money)
+        elif endpoint == "legal":
+            payload = LEGAL
+        elif endpoint == "observe":
+            payload = {"state": make_state(self.money), "legal": LEGAL}
+        elif endpoint == "action":
+            self.money -= 1
+            payload = {"ok": True, "state": make_state(self.money), "legal": LEGAL}
+        else:
+            raise AssertionError(f"unexpected endpoint {endpoint}")
+        return orjson.dumps(payload)
+
+
+def make_client(cache_ttl: float) -> tuple[BalatroClient, StubBridge]:
+    """Create a client whose requests go to a StubBridge."""
+    client = BalatroClient(cache_ttl=cache_ttl)
+    bridge = StubBridge()
+    client._request_raw = bridge
+    return client, bridge
+
+
+@pytest.fixture
+def cached():
+    """A client caching observations for a minute, with its stub bridge."""
+    client, bridge = make_client(cache_ttl=60.0)
+    yield client, bridge
+    client.close()
+
+
+class TestObservationCache:
+    """Tests for the generation/TTL observation cache."""
+
+    def test_no_ttl_always_refetches(self):
+        """With cache_ttl=0 every read should go to the bridge."""
+        client, bridge = make_client(cache_ttl=0.0)
+        client.get_state()
+        client.get_state()
+        client.get_legal_actions()
+        client.get_legal_actions()
+        client.get_observation()
+        client.get_observation()
+        client.close()
+        assert bridge.calls == ["state", "state", "legal", "legal", "observe", "observe"]
+
+    def test_hit_within_ttl_is_reused(self, cached):
+        """Reads within the TTL and generation should reuse the fetched values."""
+        client, bridge = cached
+        state, legal = client.get_observation()
+        assert client.get_state() is state
+        assert client.get_legal_actions() is legal
+        assert client.get_observation() == (state, legal)
+        assert bridge.calls == ["observe"]
+
+    def test_expired_entry_is_refetched(self, cached):
+        """Entries older than cache_ttl should be fetched again."""
+        client, bridge = cached
+        client.get_state()
+        client.cache_ttl = 0.0
+        client.get_state()
+        assert bridge.calls == ["state", "state"]
+
+    def test_action_bumps_generation_and_seeds_cache(self, cached):
+        """An action should invalidate old entries and cache the result's snapshot."""
+        client, bridge = cached
+        before = client.get_state()
+        generation = client._generation
+
+        result = client.execute_action(SHOP_END_REQUEST)
+
+        assert client._generation > generation
+        assert client.get_state() is result.state
+        assert client.get_legal_actions() is result.legal
+        assert client.get_state().money == before.money - 1
+        assert bridge.calls == ["state", "action"]
+
+    def test_wait_for_state_always_polls_bridge(self, cached):
+        """wait_for_state should bypass the cache on every poll."""
+        client, bridge = cached
+        cached_state = client.get_state()
+
+        state = client.wait_for_state(lambda s: True)
+
+        assert state is not cached_state
+        assert bridge.calls == ["state", "state"]
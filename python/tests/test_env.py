@@ -0,0 +1,100 @@
+"""Tests for the Gymnasium environment wrapper.
+
+These are offline unit tests and do not require the game to be running;
+the bridge client is replaced by a stub returning a fixed shop state.
+
+Run with: pytest tests/test_env.py -v
+"""
+
+import pytest
+
+from balatro_env.env import BalatroEnv
+from balatro_env.schemas import ActionResult, GameState, LegalActions
+
+STATE = GameState.model_validate({
+    "schema_version": "1.0.0",
+    "timestamp_ms": 0,
+    "phase": "SHOP",
+    "money": 10,
+})
+
+LEGAL = LegalActions.model_validate({
+    "schema_version": "1.0.0",
+    "phase": "SHOP",
+    "actions": [
+        {"type": "SHOP_REROLL", "description": "Reroll shop"},
+        {"type": "SHOP_END", "description": "Leave shop"},
+    ],
+})
+
+FULL_INFO_KEYS = {
+    "step_count", "episode_reward", "connected", "phase", "money", "ante", "round",
+    "hands_remaining", "discards_remaining", "hand_size", "joker_count", "action_mask",
+}
+
+
+class StubClient:
+    """Stands in for BalatroClient, always reporting the same shop state."""
+
+    def reset(self, seed=None):
+        return STATE, LEGAL
+
+    def step(self, action):
+        return ActionResult(ok=True, state=STATE, legal=LEGAL), STATE, LEGAL
+
+    def close(self):
+        pass
+
+
+def make_env(info_mode: str) -> BalatroEnv:
+    """Create an environment wired to a StubClient."""
+    env = BalatroEnv(wait_for_connection=False, info_mode=info_mode)
+    env.client.close()
+    env.client = StubClient()
+    return env
+
+
+class TestInfoMode:
+    """Tests for what step() puts in info."""
+
+    @pytest.mark.parametrize(
+        ("info_mode", "expected_keys"),
+        [
+            ("full", FULL_INFO_KEYS),
+            ("mask_only", {"action_mask"}),
+            ("minimal", set()),
+        ],
+    )
+    def test_step_info_keys(self, info_mode, expected_keys):
+        """Non-terminal steps should only carry the keys of the info mode."""
+        env = make_env(info_mode)
+        _, info = env.reset()
+        # Reset always returns full info
+        assert set(info) == FULL_INFO_KEYS
+
+        _, _, terminated, truncated, info = env.step(env.sample_legal_action())
+        assert not terminated and not truncated
+        assert set(info) == expected_keys
+
+    def test_invalid_info_mode(self):
+        """Unknown info modes should be rejected."""
+        with pytest.raises(ValueError):
+            BalatroEnv(wait_for_connection=False, info_mode="verbose")
+
+
+class TestActionMask:
+    """Tests for the masks the environment hands out."""
+
+    def test_returned_masks_are_independent_copies(self):
+        """Changing a returned mask should not change the env's own mask."""
+        env = make_env("full")
+        _, info = env.reset()
+        legal_count = int(env.get_action_mask().sum())
+        assert legal_count == 2
+
+        mask = env.get_action_mask()
+        mask[:] = False
+        info["action_mask"][:] = False
+
+        assert int(env.get_action_mask().sum()) == legal_count
+        assert env.get_action_mask()[env.sample_legal_action()]
@@ -11,10 +11,11 @@ import pytest
 from balatro_env.client import BalatroClient, BalatroConnectionError
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a client instance."""
-    return BalatroClient(host="127.0.0.1", port=7777, timeout=5.0, retry_count=1)
+    """Create a client instance, shared by the module's tests."""
+    with BalatroClient(host="127.0.0.1", port=7777, timeout=5.0, retry_count=1) as client:
+        yield client
 
 
 class TestHealthEndpoint:
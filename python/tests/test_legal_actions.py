@@ -12,13 +12,14 @@ from balatro_env.client import BalatroClient, BalatroConnectionError
 from balatro_env.schemas import ActionType, GamePhase, LegalActions
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a client instance."""
-    return BalatroClient(host="127.0.0.1", port=7777, timeout=5.0, retry_count=1)
+    """Create a client instance, shared by the module's tests."""
+    with BalatroClient(host="127.0.0.1", port=7777, timeout=5.0, retry_count=1) as client:
+        yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def legal_actions(client) -> LegalActions:
     """Fetch current legal actions."""
     try:
@@ -60,9 +61,8 @@ class TestPhaseSpecificActions:
         try:
             legal = client.get_legal_actions()
             if legal.phase == GamePhase.SHOP:
-                action_types = {a.type for a in legal.actions}
                 # Should have at least end shop action
-                assert ActionType.SHOP_END in action_types
+                assert any(a.type is ActionType.SHOP_END for a in legal.actions)
         except BalatroConnectionError:
             pytest.skip("Balatro bridge not running")
 
@@ -71,9 +71,11 @@ class TestPhaseSpecificActions:
         try:
             legal = client.get_legal_actions()
             if legal.phase == GamePhase.SELECTING_HAND:
-                action_types = {a.type for a in legal.actions}
                 # Should have play hand action
-                assert ActionType.PLAY_HAND in action_types or ActionType.DISCARD in action_types
+                assert any(
+                    a.type is ActionType.PLAY_HAND or a.type is ActionType.DISCARD
+                    for a in legal.actions
+                )
         except BalatroConnectionError:
             pytest.skip("Balatro bridge not running")
 
@@ -86,7 +88,7 @@ class TestPhaseSpecificActions:
                     assert action.params is not None
                     assert action.params.card_indices is not None
                     # Should have available indices
-                    available = action.params.card_indices.get("available", [])
+                    available = action.params.card_indices.available or []
                     assert len(available) > 0
         except BalatroConnectionError:
             pytest.skip("Balatro bridge not running")
@@ -0,0 +1,66 @@
+"""Tests for parsing bridge payloads into the Pydantic schemas.
+
+These are offline unit tests and do not require the game to be running.
+
+Run with: pytest tests/test_schemas.py -v
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from balatro_env.schemas import CardData, GamePhase, GameState, JokerData, ShopData
+
+
+class TestLuaCoercion:
+    """Tests for values the Lua bridge encodes differently from the schema."""
+
+    def test_numeric_ids_and_ranks_become_strings(self):
+        """Lua numbers for id, rank and run_id should parse as strings."""
+        card = CardData.model_validate_json('{"id": 12, "rank": 10, "suit": "Hearts"}')
+        assert card.id == "12"
+        assert card.rank == "10"
+        assert JokerData.model_validate({"id": 7}).id == "7"
+
+        state = GameState.model_validate({
+            "schema_version": "1.0.0",
+            "timestamp_ms": 0,
+            "phase": "SHOP",
+            "run_id": 42,
+        })
+        assert state.run_id == "42"
+
+    def test_other_string_fields_reject_numbers(self):
+        """Coercion should be limited to the Lua-numeric fields."""
+        with pytest.raises(ValidationError):
+            CardData.model_validate({"id": 1, "suit": 3})
+
+    def test_empty_lua_table_is_empty_list(self):
+        """An empty Lua table arrives as {} and should validate as []."""
+        shop = ShopData.model_validate_json('{"jokers": {}, "vouchers": [], "boosters": {}}')
+        assert shop.jokers == []
+        assert shop.boosters == []
+
+        state = GameState.model_validate_json(
+            '{"schema_version": "1.0.0", "timestamp_ms": 0, "phase": "SHOP",'
+            ' "hand": {}, "jokers": {}}'
+        )
+        assert state.hand == []
+        assert state.jokers == []
+
+    def test_phase_raw_keeps_original_phase(self):
+        """phase_raw should hold the phase string before enum mapping."""
+        state = GameState.model_validate({
+            "schema_version": "1.0.0",
+            "timestamp_ms": 0,
+            "phase": "STATE_17",
+        })
+        assert state.phase is GamePhase.UNKNOWN
+        assert state.phase_raw == "STATE_17"
+
+        state = GameState.model_validate({
+            "schema_version": "1.0.0",
+            "timestamp_ms": 0,
+            "phase": "SHOP",
+        })
+        assert state.phase is GamePhase.SHOP
+        assert state.phase_raw == "SHOP"
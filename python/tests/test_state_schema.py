@@ -12,13 +12,14 @@ from balatro_env.client import BalatroClient, BalatroConnectionError
 from balatro_env.schemas import GamePhase, GameState
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a client instance."""
-    return BalatroClient(host="127.0.0.1", port=7777, timeout=5.0, retry_count=1)
+    """Create a client instance, shared by the module's tests."""
+    with BalatroClient(host="127.0.0.1", port=7777, timeout=5.0, retry_count=1) as client:
+        yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def game_state(client) -> GameState:
     """Fetch current game state."""
     try:
@@ -0,0 +1,63 @@
+"""Tests for artifact helpers.
+
+These are offline unit tests and do not require the game to be running.
+
+Run with: pytest tests/test_util.py -v
+"""
+
+from balatro_env import util
+from balatro_env.schemas import GameState
+from balatro_env.util import close_ndjson_streams, save_state_artifact, save_state_ndjson
+
+
+def make_state(money: int) -> GameState:
+    """Build a minimal game state."""
+    return GameState.model_validate({
+        "schema_version": "1.0.0",
+        "timestamp_ms": 1000 + money,
+        "phase": "SHOP",
+        "money": money,
+    })
+
+
+class TestStateNdjson:
+    """Tests for appending states to an NDJSON artifact."""
+
+    def test_appends_one_state_per_line(self, tmp_path):
+        """Saved states should read back line by line, flushed before closing."""
+        path = tmp_path / "run" / "states.ndjson"
+        try:
+            assert save_state_ndjson(make_state(4), path) == path.resolve()
+            # A different spelling of the same file shares the open stream
+            save_state_ndjson(make_state(9), tmp_path / "run" / ".." / "run" / "states.ndjson")
+            assert len(util._ndjson_files) == 1
+
+            lines = path.read_bytes().splitlines()
+        finally:
+            close_ndjson_streams()
+
+        states = [GameState.model_validate_json(line) for line in lines]
+        assert [state.money for state in states] == [4, 9]
+        assert states[0] == make_state(4)
+
+
+class TestJsonArtifacts:
+    """Tests for per-snapshot JSON artifacts."""
+
+    def test_state_artifact_is_utf8(self, tmp_path):
+        """Non-ASCII text should be saved as UTF-8 regardless of locale."""
+        state = make_state(5)
+        state.error = "Bridge error: ★ Über Joker"
+
+        path = save_state_artifact(state, tmp_path)
+
+        assert GameState.model_validate_json(path.read_bytes()) == state
+
+    def test_relative_dir_is_created_after_chdir(self, tmp_path, monkeypatch):
+        """A relative output dir should be created again under a new cwd."""
+        for cwd in (tmp_path / "a", tmp_path / "b"):
+            cwd.mkdir()
+            monkeypatch.chdir(cwd)
+            path = save_state_artifact(make_state(1), "artifacts")
+            assert path.parent.resolve() == (cwd / "artifacts").resolve()
+            assert path.is_file()